@@ -1,36 +1,195 @@
 import os
+import json
+import re
+import threading
+from urllib.parse import parse_qs, urlparse
 import time
 import sys
-import requests
+import atexit
+import argparse
+import importlib.util
+import cProfile
+import concurrent.futures as futures
+import gzip
+import random
+import socketserver
+import sqlite3
+import struct
+import tempfile
+import tracemalloc
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from pypresence import Presence
-from pypresence.exceptions import PipeClosed
-import tzlocal
 from zoneinfo import ZoneInfo
-from requests.exceptions import RequestException
-from dotenv import load_dotenv
 
-# Load .env variables
-load_dotenv()
-CLIENT_ID = os.getenv("CLIENT_ID")
+def lazy_import(name):
+    """Return module name, imported on first attribute access, or None if it is not installed.
 
-if not CLIENT_ID:
-    print("CLIENT_ID is not set. Please add it to your .env file.")
-    sys.exit(1)
+    Keeps --help, argument errors and offline team validation from paying for requests,
+    pypresence, asyncio and friends.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    if "." in name:
+        # module_from_spec() does not bind submodules, and code such as asyncio.tasks
+        # reaches concurrent.futures through the parent package.
+        parent, _, child = name.rpartition(".")
+        setattr(importlib.import_module(parent), child, module)
+    return module
+
+def resolve_imports(*modules):
+    """Finish lazy imports on the calling thread.
+
+    LazyLoader is not thread-safe before Python 3.12, so modules that worker threads use
+    first are loaded here, before those threads start.
+    """
+    for module in modules:
+        if module is not None:
+            vars(module)
+
+asyncio = lazy_import("asyncio")
+http_server = lazy_import("http.server")
+requests = lazy_import("requests")
+pypresence = lazy_import("pypresence")
+tzlocal = lazy_import("tzlocal")
+dotenv = lazy_import("dotenv")
+# Optional faster JSON decoders, see json_backends().
+orjson = lazy_import("orjson")
+msgspec = lazy_import("msgspec")
 
 DEFAULT_BASE_ICON_FILLED = "🟨"
 DEFAULT_BASE_ICON_EMPTY = "⬜"
 DEFAULT_LIVE_INTERVAL = 15
+DEFAULT_EVENT_INTERVAL = 5
 DEFAULT_IDLE_INTERVAL = 90
-
-TEAM_DATA_URL = "https://statsapi.mlb.com/api/v1/teams?sportId=1"
-SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule/games/?sportId=1&hydrate=linescore(runners),boxscore,team"
+DEFAULT_BREAK_INTERVAL = 45
+DEFAULT_DELAY_INTERVAL = 300
+DEFAULT_PREGAME_LEAD = 15 * 60
+DEFAULT_MAX_IDLE_SLEEP = 60 * 60
+DEFAULT_IDLE_DEADLINE = 8
+DEFAULT_SERVER_PORT = 8765
+SUBSCRIBE_WAIT = 30
+ERROR_BACKOFF_BASE = 5
+ERROR_BACKOFF_MAX = 300
+# Discord accepts roughly five activity updates per 20 seconds.
+DISCORD_RATE_LIMIT = 5
+DISCORD_RATE_WINDOW = 20
+DISCORD_BACKOFF_BASE = 1
+DISCORD_BACKOFF_MAX = 60
+DEFAULT_POOL_SIZE = 4
+SCHEDULE_WINDOW_DAYS = 7
+# The season store re-fetches yesterday through SCHEDULE_REFRESH_DAYS ahead at most every
+# SCHEDULE_REFRESH_INTERVAL seconds, and the whole season every SEASON_RELOAD_DAYS.
+SCHEDULE_REFRESH_DAYS = 2
+SCHEDULE_REFRESH_INTERVAL = 10 * 60
+SEASON_RELOAD_DAYS = 7
+# A stored game still unfinished GAME_LENGTH seconds after first pitch is re-fetched every poll.
+GAME_LENGTH = 3 * 3600
+# After a followed game goes final, standings are revalidated at most every STANDINGS_RECHECK
+# seconds for STANDINGS_SETTLE seconds, until statsapi has counted the result.
+STANDINGS_SETTLE = 15 * 60
+STANDINGS_RECHECK = 60
+# The checkpoint is rewritten at most every CHECKPOINT_INTERVAL seconds while the presence
+# changes; a warm start shows its presence only if it is under CHECKPOINT_MAX_AGE seconds old.
+CHECKPOINT_INTERVAL = 60
+CHECKPOINT_MAX_AGE = 6 * 3600
+DEFAULT_REPLAY_SPEED = 60
+DEFAULT_METRICS_PORT = 9108
+DEFAULT_METRICS_DUMP_INTERVAL = 60
+DEFAULT_PROFILE_TICKS = 20
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+FIXTURE_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# (connect, read) timeout in seconds, retry count and backoff factor per endpoint.
+# Live polls fail fast because the next tick is only seconds away.
+ENDPOINT_POLICIES = {
+    "teams": {"timeout": (3.05, 10), "retries": 2, "backoff": 1.0},
+    "live": {"timeout": (3.05, 6), "retries": 1, "backoff": 0.5},
+    "feed": {"timeout": (3.05, 10), "retries": 1, "backoff": 0.5},
+    "schedule": {"timeout": (3.05, 10), "retries": 2, "backoff": 1.0},
+    "standings": {"timeout": (3.05, 10), "retries": 2, "backoff": 1.0},
+}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Seconds a cached response is served without asking statsapi again. Live data is
+# never served from memory but is still revalidated with ETag/If-Modified-Since.
+ENDPOINT_TTLS = {"teams": 24 * 3600, "live": 0, "schedule": 10 * 60, "standings": 30 * 60}
+# Seconds past its TTL a cached response is still served, refreshed in the background, or
+# while statsapi fails. Live data never is; the poll loop shows the last presence's age instead.
+ENDPOINT_STALE = {"teams": 7 * 24 * 3600, "schedule": 6 * 3600, "standings": 6 * 3600}
+# Consecutive failures that open an endpoint's circuit breaker, and the seconds it stays open
+# before letting one probe through (doubled after each failed probe, up to the maximum).
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN = 30
+BREAKER_MAX_COOLDOWN = 300
+# With a [budget], requests to these endpoints may spend the whole budget and wait up to
+# DEFAULT_BUDGET_WAIT seconds for a token; all others leave DEFAULT_BUDGET_RESERVE of it
+# for them and are dropped instead of waiting.
+LIVE_ENDPOINTS = ("live", "feed")
+DEFAULT_BUDGET_RESERVE = 0.25
+DEFAULT_BUDGET_WAIT = 5
+DEFAULT_CACHE_ENTRIES = 64
+
+# URLs are relative to the API base: statsapi.mlb.com unless MLB_API_BASE points every
+# request at another host, e.g. a local stand-in for tests.
+DEFAULT_API_BASE = "https://statsapi.mlb.com"
+TEAM_DATA_URL = "/api/v1/teams?sportId=1"
+SCHEDULE_URL = "/api/v1/schedule/games/?sportId=1&hydrate=linescore(runners),boxscore,team"
+# Same query without the boxscore, used once the game's player index has been built.
+SCHEDULE_LEAN_URL = "/api/v1/schedule/games/?sportId=1&hydrate=linescore(runners),team"
+# Every field build_presence and its helpers read; statsapi drops everything else.
+LIVE_FIELDS = (
+    "dates,games,gamePk,gameDate,seriesGameNumber,gamesInSeries,"
+    "status,abstractGameState,detailedState,venue,name,"
+    "teams,home,away,score,isWinner,leagueRecord,wins,losses,team,id,abbreviation,fileCode,"
+    "linescore,currentInning,inningState,outs,balls,strikes,offense,defense,first,second,third,"
+    "batter,pitcher,fullName"
+)
+LIVE_TEAM_URL = f"{SCHEDULE_URL}&teamId={{}}&fields={LIVE_FIELDS},boxscore,players,person"
+LIVE_TEAM_LEAN_URL = f"{SCHEDULE_LEAN_URL}&teamId={{}}&fields={LIVE_FIELDS}"
+MAX_PLAYER_INDEXES = 8
+FEED_URL = "/api/v1.1/game/{}/feed/live"
+FEED_DIFF_URL = "/api/v1.1/game/{}/feed/live/diffPatch?startTimecode={}"
+TEAM_SCHEDULE_URL = "/api/v1/schedule?sportId=1&teamId={}&startDate={}&endDate={}"
+# Both leagues in one request, trimmed to the fields Standings indexes.
+STANDINGS_URL = (
+    "/api/v1/standings?leagueId=103,104&season={}&standingsTypes=regularSeason"
+    "&fields=records,teamRecords,team,id,wins,losses,gamesBack,streak,streakCode"
+)
+TEAM_CACHE_FILE = "team_cache.json"
+SCHEDULE_CACHE_FILE = "schedule_cache.sqlite3"
+CHECKPOINT_FILE = "checkpoint.json"
+# (id, abbreviation, name) for validating --team offline before any team cache exists,
+# and the last resort if statsapi is unreachable on first run.
+BUNDLED_TEAMS = (
+    (108, "LAA", "Los Angeles Angels"), (109, "AZ", "Arizona Diamondbacks"),
+    (110, "BAL", "Baltimore Orioles"), (111, "BOS", "Boston Red Sox"),
+    (112, "CHC", "Chicago Cubs"), (113, "CIN", "Cincinnati Reds"),
+    (114, "CLE", "Cleveland Guardians"), (115, "COL", "Colorado Rockies"),
+    (116, "DET", "Detroit Tigers"), (117, "HOU", "Houston Astros"),
+    (118, "KC", "Kansas City Royals"), (119, "LAD", "Los Angeles Dodgers"),
+    (120, "WSH", "Washington Nationals"), (121, "NYM", "New York Mets"),
+    (133, "ATH", "Athletics"), (134, "PIT", "Pittsburgh Pirates"),
+    (135, "SD", "San Diego Padres"), (136, "SEA", "Seattle Mariners"),
+    (137, "SF", "San Francisco Giants"), (138, "STL", "St. Louis Cardinals"),
+    (139, "TB", "Tampa Bay Rays"), (140, "TEX", "Texas Rangers"),
+    (141, "TOR", "Toronto Blue Jays"), (142, "MIN", "Minnesota Twins"),
+    (143, "PHI", "Philadelphia Phillies"), (144, "ATL", "Atlanta Braves"),
+    (145, "CWS", "Chicago White Sox"), (146, "MIA", "Miami Marlins"),
+    (147, "NYY", "New York Yankees"), (158, "MIL", "Milwaukee Brewers"),
+)
 LOGO_TEMPLATE = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/mlb/500/{}.png&h=64&w=64"
 
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import toml as tomllib
+tomllib = lazy_import("tomllib") or lazy_import("toml")
 
 def ordinal(n):
     return f"{n}{'th' if 11 <= n % 100 <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
@@ -38,8 +197,7 @@ def ordinal(n):
 def format_start_time(game, tz):
     """Return formatted local start time for a game."""
     try:
-        dt = datetime.fromisoformat(game.get("gameDate").replace("Z", "+00:00"))
-        local_dt = dt.astimezone(tz)
+        local_dt = game.start.astimezone(tz)
         return local_dt.strftime("%a %H:%M %Z")
     except Exception:
         return None
@@ -54,104 +212,1688 @@ def load_config():
         print("Error loading config.toml:", e)
         return {}
 
-def parse_args(config):
-    team_abbr = config.get("team")
-    tz_name = config.get("timezone")
-    live_only = config.get("live_only", False)
-
-    args = sys.argv[1:]
-    for i, arg in enumerate(args):
-        if arg == "--team" and i + 1 < len(args):
-            team_abbr = args[i + 1].upper()
-        elif arg == "--tz" and i + 1 < len(args):
-            tz_name = args[i + 1]
-        elif arg == "--live-only":
-            live_only = True
-
-    if not team_abbr:
-        print("Usage: python script.py --team <TEAM_ABBR> [--tz TIMEZONE] [--live-only]")
-        sys.exit(1)
-
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="mlb-discord-rpc.py",
+        description="Show your MLB team's games as Discord Rich Presence.",
+    )
+    parser.add_argument("--team", metavar="TEAM_ABBR[,TEAM_ABBR...]",
+                        help="team abbreviation, or several separated by commas (default: team/teams in config.toml)")
+    parser.add_argument("--tz", metavar="TIMEZONE", help="IANA timezone name (default: detected local timezone)")
+    parser.add_argument("--live-only", action="store_true", default=None,
+                        help="only show a presence while the team has a live game")
+    parser.add_argument("--live-feed", action="store_true", default=None,
+                        help="follow live games with GUMBO diff patches instead of the schedule")
+    parser.add_argument("--live-events", action="store_true", default=None,
+                        help="poll the live feed often and refresh the presence only when a play-level event happens")
+    parser.add_argument("--async", dest="async_runtime", action="store_true", default=None,
+                        help="run fetching, rendering and publishing as asyncio tasks")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--serve", metavar="[HOST:]PORT", help="serve game state over HTTP instead of updating Discord")
+    mode.add_argument("--subscribe", metavar="URL", help="mirror the presence from a --serve instance")
+    parser.add_argument("--metrics", metavar="[HOST:]PORT", help="serve Prometheus metrics at /metrics")
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile of the first --profile-ticks polls")
+    parser.add_argument("--profile-ticks", metavar="N", type=int, default=DEFAULT_PROFILE_TICKS)
+    fixtures = parser.add_argument_group("fixtures and benchmarks")
+    fixtures.add_argument("--record", metavar="FILE", help="also append every statsapi response to a fixture archive")
+    fixtures.add_argument("--replay", metavar="FILE", help="answer statsapi requests from a fixture archive")
+    fixtures.add_argument("--speed", metavar="N", type=float, default=DEFAULT_REPLAY_SPEED,
+                          help="replay clock speed-up (default: %(default)s)")
+    fixtures.add_argument("--bench-replay", metavar="FILE", help="benchmark the poll loop over a fixture archive")
+    fixtures.add_argument("--compare-live", action="store_true",
+                          help="compare the league-wide and team-filtered live queries")
+    fixtures.add_argument("--bench-decode", action="store_true", help="benchmark the JSON decoders")
+    fixtures.add_argument("--fake-discord", metavar="PIPE", nargs="?", type=int, const=0,
+                          help="run a stand-in Discord client on IPC pipe PIPE (default: 0) and print what it is sent")
+    return parser
+
+def parse_args(config, argv=None):
+    """Return the command line merged over config.toml, with teams validated offline.
+
+    Adds team_abbrs (from --team, which accepts a comma-separated list, or team/teams)
+    and local_tz to the argparse namespace.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.fake_discord is not None:
+        return args
+
+    team_abbr = args.team or config.get("team")
+    if not args.team and config.get("teams"):
+        team_abbr = ",".join(config["teams"])
+    if args.live_only is None:
+        args.live_only = config.get("live_only", False)
+    tz_name = args.tz or config.get("timezone")
+
+    if not team_abbr and not config.get("profiles"):
+        parser.error("--team is required unless team, teams or [[profiles]] is set in config.toml")
+
+    args.team_abbrs = [abbr.strip().upper() for abbr in (team_abbr or "").split(",") if abbr.strip()]
+    known = known_team_abbrs(config.get("team_cache", TEAM_CACHE_FILE))
+    requested = args.team_abbrs
+    if config.get("profiles") and not args.team:
+        requested = [entry.get("team", "").upper() for entry in config["profiles"]]
+    unknown = [abbr for abbr in requested if abbr not in known]
+    if unknown:
+        parser.error(f"unknown team abbreviation {', '.join(unknown)} (choose from {', '.join(sorted(known))})")
+
+    # Only now, so a mistyped team is reported without importing tzlocal.
     try:
-        local_tz = ZoneInfo(tz_name) if tz_name else ZoneInfo(tzlocal.get_localzone_name())
+        args.local_tz = ZoneInfo(tz_name) if tz_name else ZoneInfo(tzlocal.get_localzone_name())
     except Exception as e:
-        print(f"Invalid timezone '{tz_name}':", e)
-        sys.exit(1)
+        parser.error(f"invalid timezone '{tz_name}': {e}")
+    return args
+
+def build_profiles(config, args, client_id):
+    """Return one profile dict per followed team.
+
+    [[profiles]] tables in config.toml are used unless --team was given. Each profile
+    needs its own Discord client, so teams listed with --team/teams get pipes 0, 1, 2...
+    """
+    if config.get("profiles") and not args.team:
+        profiles = []
+        for entry in config["profiles"]:
+            try:
+                tz = ZoneInfo(entry["timezone"]) if entry.get("timezone") else args.local_tz
+            except Exception as e:
+                print(f"Invalid timezone '{entry.get('timezone')}':", e)
+                sys.exit(1)
+            profiles.append({
+                "team": entry["team"].upper(),
+                "timezone": tz,
+                "live_only": entry.get("live_only", args.live_only),
+                "client_id": entry.get("client_id", client_id),
+                "pipe": entry.get("pipe"),
+            })
+        return profiles
+    return [
+        {
+            "team": abbr,
+            "timezone": args.local_tz,
+            "live_only": args.live_only,
+            "client_id": client_id,
+            "pipe": i if len(args.team_abbrs) > 1 else None,
+        }
+        for i, abbr in enumerate(args.team_abbrs)
+    ]
+
+def load_client_id():
+    """Return the Discord application id from the environment or .env."""
+    dotenv.load_dotenv()
+    return os.getenv("CLIENT_ID")
+
+class Clock:
+    """Wall and monotonic time for the poll loop; a ReplayClock stands in while replaying fixtures."""
+
+    def now(self):
+        return datetime.now(timezone.utc)
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(max(seconds, 0))
+
+class ReplayClock(Clock):
+    """Time that starts at a fixture archive's recording start and runs speed times faster.
+
+    With speed=0 sleeping returns at once and just advances the clock, for benchmarks.
+    """
+
+    def __init__(self, start, speed=0):
+        self.start = start
+        self.speed = speed
+        self.offset = 0.0
+        self.real_start = time.monotonic()
+
+    def elapsed(self):
+        if self.speed:
+            return (time.monotonic() - self.real_start) * self.speed
+        return self.offset
+
+    def now(self):
+        return self.start + timedelta(seconds=self.elapsed())
+
+    def monotonic(self):
+        return self.elapsed()
+
+    def sleep(self, seconds):
+        if self.speed:
+            time.sleep(max(seconds, 0) / self.speed)
+        else:
+            self.offset += max(seconds, 0)
+
+clock = Clock()
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(METRIC_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(METRIC_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self):
+        """Return [(upper bound, observations <= bound)] including +Inf, as Prometheus expects."""
+        result = []
+        running = 0
+        for bound, count in zip(METRIC_BUCKETS + (float("inf"),), self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+class Metrics:
+    """Counters and latency histograms for each stage of the poll loop, keyed by name and labels."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def prometheus(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        seen = set()
+        with self.lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}{_metric_labels(labels)} {value}")
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# TYPE {name} histogram")
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{name}_bucket{_metric_labels(labels + (('le', le),))} {count}")
+                lines.append(f"{name}_sum{_metric_labels(labels)} {histogram.total:.6f}")
+                lines.append(f"{name}_count{_metric_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": round(histogram.total, 6),
+                        "buckets": {
+                            ("+Inf" if bound == float("inf") else f"{bound:g}"): count
+                            for bound, count in histogram.cumulative()
+                        },
+                    }
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                ],
+            }
+
+def _metric_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+metrics = Metrics()
+
+def json_backends():
+    """Return {backend: loads} for the installed JSON backends, fastest first."""
+    available = {}
+    if orjson is not None:
+        available["orjson"] = orjson.loads
+    if msgspec is not None:
+        available["msgspec"] = msgspec.json.decode
+    available["json"] = json.loads
+    return available
+
+def json_decoder(name="auto"):
+    """Return (backend, loads) for name, or for the fastest installed backend when name is "auto"."""
+    available = json_backends()
+    if name == "auto":
+        name = next(iter(available))
+    elif name not in available:
+        print(f"JSON backend {name!r} is not installed, using the standard library.")
+        name = "json"
+    return name, available[name]
+
+GAMES_ARRAY = re.compile(r'"games"\s*:\s*\[')
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_scan_decoder = json.JSONDecoder()
+
+def scan_team_games(content, team_ids):
+    """Decode the first date's games one at a time and stop once every team in team_ids has one.
+
+    Returns a schedule-shaped dict holding only the matched games, so find_team_game() works on it.
+    """
+    text = content.decode("utf-8") if isinstance(content, bytes) else content
+    match = GAMES_ARRAY.search(text)
+    if not match:
+        return {"dates": []}
+    wanted = set(team_ids)
+    games = []
+    pos = match.end()
+    while wanted:
+        pos = JSON_WHITESPACE.match(text, pos).end()
+        if text.startswith("]", pos):
+            break
+        game, pos = _scan_decoder.raw_decode(text, pos)
+        teams = game.get("teams", {})
+        ids = {teams.get(side, {}).get("team", {}).get("id") for side in ("home", "away")}
+        if wanted & ids:
+            games.append(game)
+            wanted -= ids
+        pos = JSON_WHITESPACE.match(text, pos).end()
+        if text.startswith(",", pos):
+            pos += 1
+    return {"dates": [{"games": games}]}
+
+class CacheEntry:
+    __slots__ = ("data", "etag", "last_modified", "fetched")
+
+    def __init__(self, data, etag, last_modified, fetched):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = fetched
+
+class ResponseCache:
+    """Bounded LRU cache of decoded responses keyed by URL with per-endpoint TTLs."""
+
+    def __init__(self, ttls=None, max_entries=DEFAULT_CACHE_ENTRIES, stale=None):
+        self.ttls = {**ENDPOINT_TTLS, **(ttls or {})}
+        self.stale_ttls = {**ENDPOINT_STALE, **(stale or {})}
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def lookup(self, url):
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is not None:
+                self.entries.move_to_end(url)
+            return entry
+
+    def is_fresh(self, entry, endpoint, now=None):
+        ttl = self.ttls.get(endpoint, 0)
+        return ttl > 0 and (now or clock.monotonic()) - entry.fetched < ttl
+
+    def is_usable(self, entry, endpoint, now=None):
+        """Return True if entry may still be served stale: past its TTL, but not by too much."""
+        stale = self.stale_ttls.get(endpoint, 0)
+        return stale > 0 and (now or clock.monotonic()) - entry.fetched < self.ttls.get(endpoint, 0) + stale
+
+    def store(self, url, endpoint, data, headers):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (self.ttls.get(endpoint, 0) or etag or last_modified):
+            return
+        with self.lock:
+            self.entries[url] = CacheEntry(data, etag, last_modified, clock.monotonic())
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def dump(self):
+        """Return the entries, oldest first, as JSON-ready [key, data, etag, last_modified, age] lists."""
+        now = clock.monotonic()
+        with self.lock:
+            return [[key, e.data, e.etag, e.last_modified, now - e.fetched] for key, e in self.entries.items()]
+
+    def restore(self, entries, elapsed=0):
+        """Load entries from dump(), aged by the elapsed seconds since they were dumped."""
+        now = clock.monotonic()
+        with self.lock:
+            for key, data, etag, last_modified, age in entries[-self.max_entries:]:
+                self.entries[key] = CacheEntry(data, etag, last_modified, now - age - elapsed)
+
+    def stats(self):
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "stale": self.stale,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+        }
+
+class CircuitBreaker:
+    """Stop calling one endpoint after repeated failures, probing it again after a cooldown.
+
+    Closed, every request goes out. After `failures` failures in a row it opens and requests
+    are refused until `cooldown` seconds pass; then a single probe is let through. A successful
+    probe closes it, a failed one reopens it with the cooldown doubled up to max_cooldown.
+    """
+
+    def __init__(self, failures=BREAKER_FAILURES, cooldown=BREAKER_COOLDOWN, max_cooldown=BREAKER_MAX_COOLDOWN):
+        self.threshold = failures
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.lock = threading.Lock()
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0
+        self.trips = 0
+        self.refused = 0
+
+    def allow(self):
+        """Return True if a request may go out now; in the half-open state only the first may."""
+        with self.lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and clock.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half-open"
+                return True
+            self.refused += 1
+            return False
+
+    def retry_in(self):
+        return max(self.cooldown - (clock.monotonic() - self.opened_at), 0)
+
+    def cancel(self):
+        """Give back a probe that was allowed but never sent; the next request probes instead."""
+        with self.lock:
+            if self.state == "half-open":
+                self.state = "open"
+
+    def success(self):
+        with self.lock:
+            self.state = "closed"
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+
+    def failure(self):
+        """Count a failure; return True if it opened the breaker."""
+        with self.lock:
+            self.failures += 1
+            if self.state == "half-open":
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == "open" or self.failures < self.threshold:
+                return False
+            self.state = "open"
+            self.opened_at = clock.monotonic()
+            self.trips += 1
+            return True
+
+class TokenBucket:
+    """capacity tokens, refilled continuously at rate tokens per second."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        # Set on the first refill: --replay swaps in its own clock after the client is built.
+        self.updated = None
+
+    def refill(self, now):
+        if self.updated is not None:
+            self.tokens = min(self.capacity, self.tokens + max(now - self.updated, 0) * self.rate)
+        self.updated = now
+
+    def wait(self, floor):
+        """Return seconds until a token can be taken while leaving floor tokens in the bucket."""
+        return max(floor + 1 - self.tokens, 0) / self.rate
+
+class RequestGovernor:
+    """Per-minute and per-day request budgets shared by every statsapi request in the process.
+
+    Live requests may use every token and wait up to max_wait seconds for one. Other requests
+    leave `reserve` of each bucket untouched for live polls and are dropped rather than wait;
+    the response cache's stale data covers for them.
+    """
+
+    def __init__(self, per_minute=None, per_day=None, reserve=DEFAULT_BUDGET_RESERVE, max_wait=DEFAULT_BUDGET_WAIT):
+        self.buckets = []
+        if per_minute:
+            self.buckets.append(TokenBucket(per_minute / 60, per_minute))
+        if per_day:
+            self.buckets.append(TokenBucket(per_day / 86400, per_day))
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+        self.granted = 0
+        self.deferred = 0
+        self.dropped = 0
+
+    def acquire(self, endpoint):
+        """Take a token for one request to endpoint, waiting if allowed; return False to drop it."""
+        live = endpoint in LIVE_ENDPOINTS
+        deadline = clock.monotonic() + (self.max_wait if live else 0)
+        deferred = False
+        while True:
+            with self.lock:
+                now = clock.monotonic()
+                wait = 0
+                for bucket in self.buckets:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait(0 if live else bucket.capacity * self.reserve))
+                if wait == 0:
+                    for bucket in self.buckets:
+                        bucket.tokens -= 1
+                    self.granted += 1
+                    return True
+                if now + wait > deadline:
+                    self.dropped += 1
+                    metrics.inc("mlb_rpc_budget_total", endpoint=endpoint, result="dropped")
+                    return False
+                if not deferred:
+                    deferred = True
+                    self.deferred += 1
+                    metrics.inc("mlb_rpc_budget_total", endpoint=endpoint, result="deferred")
+            clock.sleep(wait)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "granted": self.granted,
+                "deferred": self.deferred,
+                "dropped": self.dropped,
+                "tokens": [round(bucket.tokens, 1) for bucket in self.buckets],
+            }
+
+class StatsClient:
+    """Shared keep-alive HTTP client used by every statsapi fetcher."""
+
+    def __init__(
+        self, policies=None, pool_size=DEFAULT_POOL_SIZE, cache=None, json_backend="auto", base=None, breaker=None,
+        governor=None,
+    ):
+        self.base = (base or os.getenv("MLB_API_BASE") or DEFAULT_API_BASE).rstrip("/")
+        self.json_backend, self.loads = json_decoder(json_backend)
+        self.policies = {name: dict(policy) for name, policy in ENDPOINT_POLICIES.items()}
+        for name, policy in (policies or {}).items():
+            self.policies.setdefault(name, dict(ENDPOINT_POLICIES["schedule"])).update(policy)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "mlb-discord-rpc",
+        })
+        # Retries are handled per endpoint in get(), so the adapter never retries on its own.
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes_wire = 0
+        self.bytes_decoded = 0
+        self.by_endpoint = {}
+        self.lock = threading.Lock()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.breaker_config = breaker or {}
+        self.breakers = {}
+        self.revalidating = set()
+        self.executor = None
+        self.governor = governor
+        self.recorder = None
+
+    def breaker(self, endpoint):
+        with self.lock:
+            if endpoint not in self.breakers:
+                self.breakers[endpoint] = CircuitBreaker(**self.breaker_config)
+            return self.breakers[endpoint]
+
+    def get(self, url, endpoint="schedule", headers=None):
+        if url.startswith("/"):
+            url = self.base + url
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            metrics.inc("mlb_rpc_http_refused_total", endpoint=endpoint)
+            raise requests.ConnectionError(
+                f"statsapi {endpoint} requests paused for {breaker.retry_in():.0f}s after repeated failures"
+            )
+        policy = self.policies.get(endpoint, self.policies["schedule"])
+        attempts = int(policy["retries"]) + 1
+        for attempt in range(attempts):
+            if attempt:
+                self.retries += 1
+                clock.sleep(policy["backoff"] * (2 ** (attempt - 1)))
+            if self.governor is not None and not self.governor.acquire(endpoint):
+                breaker.cancel()
+                raise requests.ConnectionError(f"statsapi request budget exhausted; {endpoint} request dropped")
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=tuple(policy["timeout"]))
+            except requests.RequestException:
+                # Dropped connections, timeouts, truncated or undecodable bodies, redirect loops:
+                # all retried, and all settle a half-open probe so the breaker cannot stick.
+                metrics.inc("mlb_rpc_http_errors_total", endpoint=endpoint)
+                self._count(endpoint, 0, 0)
+                if attempt + 1 < attempts:
+                    continue
+                self.failures += 1
+                self._trip(breaker, endpoint)
+                raise
+            metrics.observe("mlb_rpc_http_request_seconds", time.perf_counter() - started, endpoint=endpoint)
+            metrics.inc("mlb_rpc_http_responses_total", endpoint=endpoint, status=response.status_code)
+            self._count(endpoint, _wire_size(response), len(response.content))
+            if response.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+                continue
+            try:
+                response.raise_for_status()
+            except requests.RequestException:
+                self.failures += 1
+                # A 404 still means statsapi is up; only overload and server errors trip the breaker.
+                if response.status_code in RETRY_STATUSES:
+                    self._trip(breaker, endpoint)
+                else:
+                    breaker.success()
+                raise
+            breaker.success()
+            if self.recorder is not None:
+                self.recorder.record(url, response)
+            return response
+
+    def get_json(self, url, endpoint="schedule", decode=None, cache_key=None, revalidate=False, cached=True):
+        """Return decoded JSON for url, answering from the cache when possible.
+
+        decode replaces the configured backend for this call (e.g. scan_team_games); give it a
+        cache_key when its result depends on more than the URL. revalidate=True asks statsapi
+        even if the cached copy is within its TTL; cached=False bypasses the cache entirely,
+        for callers that keep the data themselves.
+        """
+        if not cached:
+            return self._fetch(url, endpoint, decode, None, None)
+        cache = self.cache
+        cache_key = cache_key or url
+        entry = cache.lookup(cache_key)
+        if entry is not None and not revalidate:
+            if cache.is_fresh(entry, endpoint):
+                cache.hits += 1
+                metrics.inc("mlb_rpc_cache_total", endpoint=endpoint, result="hit")
+                return entry.data
+            if cache.is_usable(entry, endpoint):
+                # Stale-while-revalidate: answer now, refresh for the next caller.
+                cache.stale += 1
+                metrics.inc("mlb_rpc_cache_total", endpoint=endpoint, result="stale")
+                self._revalidate_later(url, endpoint, decode, cache_key)
+                return entry.data
+        try:
+            return self._fetch(url, endpoint, decode, cache_key, entry)
+        except requests.RequestException:
+            if entry is None or not cache.is_usable(entry, endpoint):
+                raise
+            cache.stale += 1
+            metrics.inc("mlb_rpc_cache_total", endpoint=endpoint, result="stale")
+            return entry.data
+
+    def _fetch(self, url, endpoint, decode, cache_key, entry):
+        """Request url (conditionally, if entry has validators) and return its JSON, cached under cache_key if given."""
+        cache = self.cache
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = self.get(url, endpoint, headers)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated += 1
+            metrics.inc("mlb_rpc_cache_total", endpoint=endpoint, result="revalidated")
+            entry.fetched = clock.monotonic()
+            return entry.data
+        cache.misses += 1
+        metrics.inc("mlb_rpc_cache_total", endpoint=endpoint, result="miss")
+        started = time.perf_counter()
+        data = (decode or self.loads)(response.content)
+        metrics.observe("mlb_rpc_decode_seconds", time.perf_counter() - started, endpoint=endpoint)
+        if cache_key is not None:
+            cache.store(cache_key, endpoint, data, response.headers)
+        return data
+
+    def _revalidate_later(self, url, endpoint, decode, cache_key):
+        with self.lock:
+            if cache_key in self.revalidating:
+                return
+            self.revalidating.add(cache_key)
+            if self.executor is None:
+                self.executor = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="revalidate")
+        self.executor.submit(self._revalidate, url, endpoint, decode, cache_key)
+
+    def _revalidate(self, url, endpoint, decode, cache_key):
+        try:
+            self._fetch(url, endpoint, decode, cache_key, self.cache.lookup(cache_key))
+        except requests.RequestException as e:
+            print(f"Background refresh of {endpoint} failed:", e)
+        finally:
+            with self.lock:
+                self.revalidating.discard(cache_key)
+
+    def _trip(self, breaker, endpoint):
+        if breaker.failure():
+            metrics.inc("mlb_rpc_breaker_trips_total", endpoint=endpoint)
+            print(f"statsapi {endpoint} keeps failing; pausing it for {breaker.cooldown:.0f}s.")
+
+    def _count(self, endpoint, wire, decoded):
+        metrics.inc("mlb_rpc_http_bytes_total", wire, endpoint=endpoint)
+        with self.lock:
+            self.requests += 1
+            self.bytes_wire += wire
+            self.bytes_decoded += decoded
+            counts = self.by_endpoint.setdefault(endpoint, {"requests": 0, "bytes": 0})
+            counts["requests"] += 1
+            counts["bytes"] += wire
+
+    def connection_stats(self):
+        """Return (connections opened, requests sent) across the pooled hosts."""
+        opened = sent = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                sent += pool.num_requests
+        return opened, sent
+
+    def stats(self):
+        opened, sent = self.connection_stats()
+        reuse = 1 - opened / sent if sent else 0.0
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "bytes_wire": self.bytes_wire,
+            "bytes_decoded": self.bytes_decoded,
+            "connections": opened,
+            "connection_reuse": round(reuse, 3),
+            "endpoints": {name: dict(c) for name, c in self.by_endpoint.items()},
+            "cache": self.cache.stats(),
+            "breakers": {
+                name: {"state": b.state, "trips": b.trips, "refused": b.refused} for name, b in self.breakers.items()
+            },
+            "budget": self.governor.stats() if self.governor is not None else None,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (
+            f"HTTP: {s['requests']} requests ({s['retries']} retries, {s['failures']} failed), "
+            f"{s['bytes_wire'] / 1024:.1f} KiB on the wire ({s['bytes_decoded'] / 1024:.1f} KiB decoded), "
+            f"{s['connections']} connections opened, {s['connection_reuse']:.0%} reused; "
+            f"cache: {s['cache']['hits']} hits, {s['cache']['revalidated']} revalidated, "
+            f"{s['cache']['stale']} stale, {s['cache']['misses']} misses; "
+            f"breakers: {sum(b['trips'] for b in s['breakers'].values())} trips, "
+            f"{sum(b['refused'] for b in s['breakers'].values())} requests refused"
+            + (f"; budget: {s['budget']['deferred']} deferred, {s['budget']['dropped']} dropped" if s["budget"] else "")
+        )
+
+def _wire_size(response):
+    try:
+        return response.raw.tell() or len(response.content)
+    except Exception:
+        return len(response.content)
+
+_client = None
+
+def configure_client(config):
+    """Create the shared client from the optional [http] and [cache] config tables."""
+    global _client
+    http = config.get("http", {})
+    cache_config = config.get("cache", {})
+    cache = ResponseCache(
+        cache_config.get("ttl"), cache_config.get("max_entries", DEFAULT_CACHE_ENTRIES), cache_config.get("stale")
+    )
+    policies = {}
+    for name, timeout in http.get("timeouts", {}).items():
+        policies.setdefault(name, {})["timeout"] = timeout if isinstance(timeout, (list, tuple)) else (3.05, timeout)
+    for name, retries in http.get("retries", {}).items():
+        policies.setdefault(name, {})["retries"] = retries
+    budget = config.get("budget", {})
+    governor = None
+    if budget.get("per_minute") or budget.get("per_day"):
+        governor = RequestGovernor(
+            budget.get("per_minute"), budget.get("per_day"),
+            budget.get("reserve", DEFAULT_BUDGET_RESERVE), budget.get("max_wait", DEFAULT_BUDGET_WAIT),
+        )
+    _client = StatsClient(
+        policies, http.get("pool_size", DEFAULT_POOL_SIZE), cache, http.get("json", "auto"),
+        breaker=http.get("breaker"), governor=governor,
+    )
+    return _client
+
+def get_client():
+    global _client
+    if _client is None:
+        _client = StatsClient()
+    return _client
+
+def fixture_key(url):
+    """Return url without scheme and host, so fixtures replay against any API base."""
+    parsed = urlparse(url)
+    return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+
+class FixtureRecorder:
+    """Appends every successful statsapi response to a gzipped JSON-lines fixture archive."""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.count = 0
+        self.file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"version": 1, "started": clock.now().isoformat()})
+        atexit.register(self.close)
+
+    def record(self, url, response):
+        if response.status_code != 200:
+            return
+        self._write({
+            "t": round(time.monotonic() - self.started, 3),
+            "url": fixture_key(response.request.url if response.request else url),
+            "headers": {name: response.headers[name] for name in FIXTURE_HEADERS if name in response.headers},
+            "body": response.text,
+        })
+
+    def _write(self, entry):
+        with self.lock:
+            self.file.write(json.dumps(entry) + "\n")
+            # Flush every entry so an interrupted recording still replays up to that point.
+            self.file.flush()
+            self.count += 1
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def load_fixtures(path):
+    """Return (header, {url: (times, entries)}, duration) from a fixture archive."""
+    header = None
+    fixtures = {}
+    duration = 0.0
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                entry = json.loads(line)
+                if header is None:
+                    header = entry
+                    continue
+                times, entries = fixtures.setdefault(entry["url"], ([], []))
+                times.append(entry["t"])
+                entries.append(entry)
+                duration = max(duration, entry["t"])
+        except EOFError:
+            # The recorder was killed before closing the archive; keep what was flushed.
+            pass
+    if header is None:
+        raise ValueError(f"{path} is not a fixture archive")
+    return header, fixtures, duration
+
+class ReplayAdapter:
+    """Answers statsapi requests from a fixture archive with each URL's latest response for the replay clock.
+
+    URLs that were never recorded fall back to the same path with another query (e.g. an
+    older diffPatch timecode), then to 404.
+    """
+
+    def __init__(self, fixtures, replay_clock):
+        self.fixtures = fixtures
+        self.by_path = {}
+        for url, (times, entries) in fixtures.items():
+            merged = self.by_path.setdefault(url.split("?")[0], [])
+            merged.extend(zip(times, entries))
+        for path, merged in self.by_path.items():
+            merged.sort(key=lambda item: item[0])
+            self.by_path[path] = ([t for t, _ in merged], [entry for _, entry in merged])
+        self.clock = replay_clock
+        self.served = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        times, entries = self.fixtures.get(key) or self.by_path.get(key.split("?")[0]) or ([], [])
+        if not entries:
+            return None
+        i = bisect_right(times, self.clock.elapsed()) - 1
+        return entries[max(i, 0)]
+
+    def send(self, request, **kwargs):
+        entry = self.lookup(fixture_key(request.url))
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = "utf-8"
+        if entry is None:
+            self.misses += 1
+            response.status_code = 404
+            response.reason = "Not Found"
+            response._content = b""
+            return response
+        self.served += 1
+        response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+        etag = entry["headers"].get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response.reason = "Not Modified"
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.reason = "OK"
+            response._content = entry["body"].encode("utf-8")
+        return response
 
-    return team_abbr, local_tz, live_only
+    def close(self):
+        pass
 
-def get_team_abbr_map():
+def start_replay(path, speed=0):
+    """Serve statsapi from the fixture archive at path and run the clock from its recording start.
+
+    Returns (adapter, duration in seconds of the recording).
+    """
+    global clock
+    header, fixtures, duration = load_fixtures(path)
+    clock = ReplayClock(datetime.fromisoformat(header["started"]), speed)
+    adapter = ReplayAdapter(fixtures, clock)
+    session = get_client().session
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    print(f"Replaying {sum(len(entries) for _, entries in fixtures.values())} responses "
+          f"({duration / 60:.1f} min) from {path}" + (f" at {speed:g}x" if speed else ""))
+    return adapter, duration
+
+def build_team_index(teams):
+    """Index team records by id and by upper-case abbreviation."""
+    by_id = {}
+    by_abbr = {}
+    for team in teams:
+        by_id[team["id"]] = team
+        by_abbr[team["abbr"]] = team["id"]
+    return {"by_id": by_id, "by_abbr": by_abbr}
+
+def _trim_teams(data):
+    teams = []
+    for team in data.get("teams", []):
+        abbr = team["abbreviation"].upper()
+        teams.append({
+            "id": team["id"],
+            "abbr": abbr,
+            "name": team["name"],
+            "code": team.get("fileCode", abbr.lower()),
+        })
+    return teams
+
+def _read_team_cache(path):
     try:
-        response = requests.get(TEAM_DATA_URL, timeout=10)
-        return {team["id"]: team["abbreviation"] for team in response.json().get("teams", [])}
-    except RequestException as e:
-        print("Failed to fetch team abbreviation map:", e)
-        return {}
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached.get("teams"), list):
+            return cached
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Ignoring unreadable team cache {path}:", e)
+    return None
 
-def fetch_team_info(abbr):
+def _write_team_cache(path, season, teams):
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"season": season, "fetched": int(time.time()), "teams": teams}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not write team cache {path}:", e)
+
+def load_team_index(path=TEAM_CACHE_FILE):
+    """Return the team index, reading the on-disk cache and refreshing it once per season.
+
+    If statsapi cannot be reached an out-of-season cache is still used.
+    """
+    season = clock.now().year
+    cached = _read_team_cache(path)
+    if cached and cached.get("season") == season:
+        return build_team_index(cached["teams"])
     try:
-        response = requests.get(TEAM_DATA_URL, timeout=10)
-        for team in response.json().get("teams", []):
-            if team["abbreviation"].upper() == abbr.upper():
-                return {
-                    "id": team["id"],
-                    "name": team["name"],
-                    "code": team.get("fileCode", abbr.lower()),
-                    "abbr": abbr.upper()
-                }
-    except RequestException as e:
-        print("Failed to fetch team info:", e)
+        teams = _trim_teams(get_client().get_json(TEAM_DATA_URL, "teams"))
+        if teams:
+            _write_team_cache(path, season, teams)
+            return build_team_index(teams)
+    except requests.RequestException as e:
+        print("Failed to fetch team data:", e)
+    if cached:
+        print(f"Using team cache from season {cached.get('season')}.")
+        return build_team_index(cached["teams"])
+    print("Using the bundled team table.")
+    return build_team_index(bundled_teams())
+
+def bundled_teams():
+    return [{"id": team_id, "abbr": abbr, "name": name, "code": abbr.lower()} for team_id, abbr, name in BUNDLED_TEAMS]
+
+def known_team_abbrs(path=TEAM_CACHE_FILE):
+    """Return the valid team abbreviations from the team cache, or the bundled table, without the network."""
+    cached = _read_team_cache(path)
+    teams = cached["teams"] if cached else bundled_teams()
+    return {team["abbr"] for team in teams}
+
+def get_team_abbr_map(team_index):
+    return {team_id: team["abbr"] for team_id, team in team_index["by_id"].items()}
+
+def fetch_team_info(abbr, team_index):
+    team_id = team_index["by_abbr"].get(abbr.upper())
+    if team_id is None:
+        return None
+    return dict(team_index["by_id"][team_id])
+
+def live_schedule_url(team_ids, query="team", boxscore=True):
+    """Return the live schedule URL: trimmed to the given team ids, or the full league payload.
+
+    boxscore=False leaves out the boxscore hydrate once player names are indexed.
+    """
+    if query == "league":
+        return SCHEDULE_URL if boxscore else SCHEDULE_LEAN_URL
+    if isinstance(team_ids, int):
+        team_ids = [team_ids]
+    template = LIVE_TEAM_URL if boxscore else LIVE_TEAM_LEAN_URL
+    return template.format(",".join(str(team_id) for team_id in team_ids))
+
+def find_team_game(data, team_id):
+    games = (data.get("dates") or [{}])[0].get("games", [])
+    for game in games:
+        home = game["teams"]["home"]
+        away = game["teams"]["away"]
+        if team_id in (home["team"]["id"], away["team"]["id"]):
+            return game
     return None
 
-def fetch_live_game(team_id):
+def fetch_live_game(team_id, query="team"):
     try:
-        response = requests.get(SCHEDULE_URL, timeout=10)
-        data = response.json()
-        games = data.get("dates", [{}])[0].get("games", [])
-        for game in games:
-            home = game["teams"]["home"]
-            away = game["teams"]["away"]
-            if team_id in (home["team"]["id"], away["team"]["id"]):
-                return game
-    except RequestException as e:
+        data = get_client().get_json(live_schedule_url(team_id, query), "live")
+        return find_team_game(data, team_id)
+    except requests.RequestException as e:
         print("Failed to fetch live game:", e)
     return None
 
-def get_next_game_datetime(team_id, local_tz, abbr_map):
-    """Return a string describing the team's next scheduled game."""
+def _pointer_tokens(path):
+    if not path:
+        return []
+    return [token.replace("~1", "/").replace("~0", "~") for token in path.lstrip("/").split("/")]
+
+def _pointer_parent(doc, tokens):
+    target = doc
+    for token in tokens[:-1]:
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target
+
+def apply_json_patch(doc, ops):
+    """Apply RFC 6902 operations to doc in place, as served by the diffPatch endpoint."""
+    for op in ops:
+        kind = op["op"]
+        tokens = _pointer_tokens(op["path"])
+        if not tokens:
+            raise ValueError("patches against the document root are not supported")
+        parent = _pointer_parent(doc, tokens)
+        key = tokens[-1]
+        if kind in ("move", "copy"):
+            from_tokens = _pointer_tokens(op["from"])
+            source = _pointer_parent(doc, from_tokens)
+            from_key = from_tokens[-1]
+            if isinstance(source, list):
+                value = source[int(from_key)]
+                if kind == "move":
+                    del source[int(from_key)]
+            else:
+                value = source[from_key]
+                if kind == "move":
+                    del source[from_key]
+            op = {"value": json.loads(json.dumps(value)) if kind == "copy" else value}
+            kind = "add"
+        if kind == "test":
+            current = parent[int(key)] if isinstance(parent, list) else parent[key]
+            if current != op["value"]:
+                raise ValueError(f"test failed at {'/'.join(tokens)}")
+        elif isinstance(parent, list):
+            if kind == "add":
+                if key == "-":
+                    parent.append(op["value"])
+                else:
+                    parent.insert(int(key), op["value"])
+            elif kind == "replace":
+                parent[int(key)] = op["value"]
+            elif kind == "remove":
+                del parent[int(key)]
+            else:
+                raise ValueError(f"unsupported patch op {kind}")
+        else:
+            if kind in ("add", "replace"):
+                parent[key] = op["value"]
+            elif kind == "remove":
+                del parent[key]
+            else:
+                raise ValueError(f"unsupported patch op {kind}")
+
+class LiveFeed:
+    """One game's GUMBO document kept current by applying diffPatch updates."""
+
+    def __init__(self, game_pk):
+        self.game_pk = game_pk
+        self.doc = None
+        self.timecode = None
+        self.full_fetches = 0
+        self.patches = 0
+
+    def update(self):
+        client = get_client()
+        if self.doc is None or not self.timecode:
+            self._replace(client.loads(client.get(FEED_URL.format(self.game_pk), "feed").content))
+            return self.doc
+        data = client.loads(client.get(FEED_DIFF_URL.format(self.game_pk, self.timecode), "feed").content)
+        if isinstance(data, dict):
+            # statsapi answers with the whole document when the timecode is too old.
+            self._replace(data)
+            return self.doc
+        try:
+            for patch in data:
+                apply_json_patch(self.doc, patch.get("diff", []))
+                self.patches += 1
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            print("Live feed patch did not apply, resyncing:", e)
+            self.doc = None
+            return self.update()
+        self.timecode = self.doc.get("metaData", {}).get("timeStamp", self.timecode)
+        return self.doc
+
+    def _replace(self, doc):
+        self.doc = doc
+        self.timecode = doc.get("metaData", {}).get("timeStamp")
+        self.full_fetches += 1
+
+def feed_to_game(feed, base_game=None):
+    """Reshape a GUMBO feed into the schedule game structure build_presence reads."""
+    base_game = base_game or {}
+    game_data = feed["gameData"]
+    live_data = feed.get("liveData", {})
+    linescore = live_data.get("linescore", {})
+    teams = {}
+    for side in ("home", "away"):
+        team = game_data["teams"][side]
+        base_side = base_game.get("teams", {}).get(side, {})
+        entry = {
+            "team": {
+                "id": team["id"],
+                "name": team.get("name"),
+                "abbreviation": team.get("abbreviation"),
+                "fileCode": team.get("fileCode"),
+            },
+            "leagueRecord": team.get("record", {}).get("leagueRecord") or base_side.get("leagueRecord", {}),
+        }
+        runs = linescore.get("teams", {}).get(side, {}).get("runs")
+        if runs is not None:
+            entry["score"] = runs
+        teams[side] = entry
+    game_info = game_data.get("game", {})
+    current_play = live_data.get("plays", {}).get("currentPlay") or {}
+    return {
+        "gamePk": game_info.get("pk", base_game.get("gamePk")),
+        "gameDate": game_data.get("datetime", {}).get("dateTime", base_game.get("gameDate")),
+        "status": game_data["status"],
+        "teams": teams,
+        "linescore": linescore,
+        "boxscore": live_data.get("boxscore", {}),
+        "seriesGameNumber": game_info.get("seriesGameNumber", base_game.get("seriesGameNumber", 0)),
+        "gamesInSeries": game_info.get("gamesInSeries", base_game.get("gamesInSeries", 0)),
+        "venue": game_data.get("venue", base_game.get("venue", {})),
+        "currentPlay": {
+            "atBatIndex": current_play.get("about", {}).get("atBatIndex"),
+            "pitches": sum(1 for event in current_play.get("playEvents", []) if event.get("isPitch")),
+        },
+    }
+
+class LiveSource:
+    """Return each followed team's game from one schedule request, or from a LiveFeed while live."""
+
+    def __init__(self, team_ids, query="team", use_feed=False, parse="full"):
+        self.team_ids = [team_ids] if isinstance(team_ids, int) else list(team_ids)
+        self.query = query
+        self.use_feed = use_feed
+        self.parse = parse
+        self.feeds = {}
+        self.game_pks = {}
+        self.full_fetches = 0
+        self.patches = 0
+
+    def fetch(self):
+        """Return the first followed team's game."""
+        return self.fetch_all()[self.team_ids[0]]
+
+    def fetch_all(self):
+        """Return {team_id: GameState or None}, with at most one schedule request per call."""
+        games = {}
+        feed_games = {}
+        for game_pk, (feed, base_game) in list(self.feeds.items()):
+            try:
+                game = feed_to_game(feed.update(), base_game)
+                if game["status"]["abstractGameState"] == "Live":
+                    feed_games[game_pk] = game
+                    continue
+            except requests.RequestException as e:
+                print("Failed to update live feed:", e)
+            self._drop_feed(game_pk)
+        for game in feed_games.values():
+            for side in ("home", "away"):
+                team_id = game["teams"][side]["team"]["id"]
+                if team_id in self.team_ids:
+                    games[team_id] = parse_game(game)
+
+        remaining = [team_id for team_id in self.team_ids if team_id not in games]
+        if not remaining:
+            return games
+        # Only teams whose game the previous fetch found can have a player index; a followed
+        # team with an off day must not keep the boxscore hydrate on every request.
+        known = [self.game_pks[team_id] for team_id in remaining if team_id in self.game_pks]
+        boxscore = not known or not all(has_player_index(game_pk) for game_pk in known)
+        url = live_schedule_url(remaining, self.query, boxscore)
+        if self.parse == "stream":
+            data = get_client().get_json(
+                url, "live",
+                decode=lambda content: scan_team_games(content, remaining),
+                cache_key=f"{url}#{','.join(str(team_id) for team_id in remaining)}",
+            )
+        else:
+            data = get_client().get_json(url, "live")
+        for team_id in remaining:
+            game = find_team_game(data, team_id)
+            games[team_id] = parse_game(game) if game else None
+            if game:
+                self.game_pks[team_id] = game.get("gamePk")
+                player_index(game)
+            else:
+                self.game_pks.pop(team_id, None)
+            if self.use_feed and game and game["status"]["abstractGameState"] == "Live":
+                self.feeds.setdefault(game["gamePk"], (LiveFeed(game["gamePk"]), game))
+        return games
+
+    def _drop_feed(self, game_pk):
+        feed, _ = self.feeds.pop(game_pk)
+        self.full_fetches += feed.full_fetches
+        self.patches += feed.patches
+
+    def summary(self):
+        full = self.full_fetches + sum(feed.full_fetches for feed, _ in self.feeds.values())
+        patches = self.patches + sum(feed.patches for feed, _ in self.feeds.values())
+        return f"Live feed: {full} full documents, {patches} diff patches applied"
+
+def compare_live_queries(team_id, runs=5):
+    """Print payload size and decode time of the league-wide and team-filtered live queries."""
+    client = get_client()
+    for query in ("league", "team"):
+        try:
+            response = client.get(live_schedule_url(team_id, query), "live")
+        except requests.RequestException as e:
+            print(f"{query}: request failed:", e)
+            continue
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            json.loads(response.content)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(
+            f"{query:>6}: {_wire_size(response) / 1024:8.1f} KiB on the wire, "
+            f"{len(response.content) / 1024:8.1f} KiB decoded, "
+            f"parse {timings[len(timings) // 2] * 1000:.2f} ms (median of {runs})"
+        )
+
+def benchmark_decoders(team_id, runs=5):
+    """Print decode time and peak memory for finding team_id's game in the league-wide live schedule."""
     try:
-        now_utc = datetime.now(timezone.utc)
-        start_date = now_utc.date()
-        end_date = (now_utc + timedelta(days=7)).date()
-        url = (
-            f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId={team_id}"
-            f"&startDate={start_date}&endDate={end_date}"
+        response = get_client().get(live_schedule_url(team_id, "league"), "live")
+    except requests.RequestException as e:
+        print("Benchmark request failed:", e)
+        return
+    content = response.content
+    paths = [
+        (f"{backend} (full)", lambda content, loads=loads: find_team_game(loads(content), team_id))
+        for backend, loads in json_backends().items()
+    ]
+    paths.append(("json (stream)", lambda content: find_team_game(scan_team_games(content, [team_id]), team_id)))
+
+    print(f"League schedule: {len(content) / 1024:.1f} KiB")
+    for label, find in paths:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            find(content)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        # Measured in a separate pass because tracemalloc slows every allocation down.
+        tracemalloc.start()
+        found = find(content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:>16}: {timings[len(timings) // 2] * 1000:8.2f} ms (median of {runs}), "
+            f"peak {peak / 1024:8.1f} KiB, {'found' if found else 'no game'}"
         )
-        response = requests.get(url, timeout=10)
-        data = response.json()
 
-        next_game = None
-        next_game_utc = None
+def parse_game_time(game):
+    return datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
+
+class Slotted:
+    """Base for the compact game-state records; fields are listed in __slots__."""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def to_dict(self):
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, Slotted):
+                value = value.to_dict()
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            result[name] = value
+        return result
+
+class TeamState(Slotted):
+    __slots__ = ("id", "name", "abbr", "code", "score", "wins", "losses", "is_winner")
+
+class LinescoreState(Slotted):
+    __slots__ = (
+        "inning", "inning_state", "outs", "balls", "strikes",
+        "first", "second", "third", "batter", "pitcher", "offense_team_id",
+    )
+
+class GameState(Slotted):
+    """One game, parsed once from a schedule or feed payload and shared by every renderer."""
+
+    __slots__ = (
+        "game_pk", "start", "abstract_state", "detailed_state",
+        "home", "away", "linescore", "series_game", "series_total", "venue",
+        "at_bat_index", "pitches",
+    )
+
+    def team(self, team_id):
+        if self.home.id == team_id:
+            return self.home
+        if self.away.id == team_id:
+            return self.away
+        return None
 
+    def sides(self, team_id):
+        """Return (team, opponent, is_home) from team_id's point of view."""
+        if self.home.id == team_id:
+            return self.home, self.away, True
+        return self.away, self.home, False
+
+    @property
+    def has_score(self):
+        """False before first pitch, when statsapi sends no score at all."""
+        return self.home.score is not None and self.away.score is not None
+
+    @property
+    def is_final(self):
+        return self.detailed_state in ("Final", "Game Over")
+
+def parse_team(side):
+    team = side.get("team", {})
+    record = side.get("leagueRecord") or {}
+    return TeamState(
+        id=team.get("id"),
+        name=team.get("name"),
+        abbr=team.get("abbreviation"),
+        code=team.get("fileCode"),
+        score=side.get("score"),
+        wins=record.get("wins"),
+        losses=record.get("losses"),
+        is_winner=side.get("isWinner"),
+    )
+
+def parse_linescore(game):
+    linescore = game.get("linescore") or {}
+    offense = linescore.get("offense") or {}
+    return LinescoreState(
+        inning=linescore.get("currentInning"),
+        inning_state=linescore.get("inningState", ""),
+        outs=linescore.get("outs"),
+        balls=linescore.get("balls"),
+        strikes=linescore.get("strikes"),
+        first=bool(offense.get("first")),
+        second=bool(offense.get("second")),
+        third=bool(offense.get("third")),
+        batter=get_batter(game),
+        pitcher=get_pitcher(game),
+        offense_team_id=(offense.get("team") or {}).get("id"),
+    )
+
+def parse_game(game):
+    """Return the GameState for a schedule-shaped game dict."""
+    status = game.get("status", {})
+    return GameState(
+        game_pk=game.get("gamePk"),
+        start=parse_game_time(game),
+        abstract_state=status.get("abstractGameState"),
+        detailed_state=status.get("detailedState", ""),
+        home=parse_team(game["teams"]["home"]),
+        away=parse_team(game["teams"]["away"]),
+        linescore=parse_linescore(game),
+        series_game=int(game.get("seriesGameNumber") or 0),
+        series_total=int(game.get("gamesInSeries") or 0),
+        venue=(game.get("venue") or {}).get("name"),
+        # Only GUMBO feed games carry the current play; schedule games leave these None.
+        at_bat_index=(game.get("currentPlay") or {}).get("atBatIndex"),
+        pitches=(game.get("currentPlay") or {}).get("pitches"),
+    )
+
+def game_events(previous, current):
+    """Return what changed between two polls of a game: the events that warrant a refresh.
+
+    Any of "game", "status", "inning", "batter", "pitcher", "pitch", "outs", "runners" and "score".
+    """
+    if previous is None or current is None or previous.game_pk != current.game_pk:
+        return [] if previous is current else ["game"]
+    before, after = previous.linescore, current.linescore
+    events = []
+    if (previous.abstract_state, previous.detailed_state) != (current.abstract_state, current.detailed_state):
+        events.append("status")
+    if (before.inning, before.inning_state) != (after.inning, after.inning_state):
+        events.append("inning")
+    if previous.at_bat_index != current.at_bat_index or before.batter != after.batter:
+        events.append("batter")
+    if before.pitcher != after.pitcher:
+        events.append("pitcher")
+    if previous.pitches != current.pitches or (before.balls, before.strikes) != (after.balls, after.strikes):
+        events.append("pitch")
+    if before.outs != after.outs:
+        events.append("outs")
+    if (before.first, before.second, before.third) != (after.first, after.second, after.third):
+        events.append("runners")
+    if (previous.home.score, previous.away.score) != (current.home.score, current.away.score):
+        events.append("score")
+    return events
+
+class ScheduleWindow:
+    """The followed team's games within +/- SCHEDULE_WINDOW_DAYS, fetched at most once per poll.
+
+    Create a new window for each poll; repeated queries on one window share a single fetch.
+    """
+
+    def __init__(self, team_id, days=SCHEDULE_WINDOW_DAYS):
+        self.team_id = team_id
+        self.days = days
+        self.times = []
+        self.games = []
+        self.loaded = False
+
+    def ensure(self):
+        if self.loaded:
+            return
+        now_utc = clock.now()
+        url = TEAM_SCHEDULE_URL.format(
+            self.team_id,
+            (now_utc - timedelta(days=self.days)).date(),
+            (now_utc + timedelta(days=self.days)).date(),
+        )
+        data = get_client().get_json(url, "schedule")
+        states = []
         for date_entry in data.get("dates", []):
             for game in date_entry.get("games", []):
-                game_utc = datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
-                if game_utc <= now_utc:
-                    continue
-                if next_game_utc is None or game_utc < next_game_utc:
-                    next_game = game
-                    next_game_utc = game_utc
+                states.append(parse_game(game))
+        states.sort(key=lambda state: state.start)
+        self.times = [state.start for state in states]
+        self.games = states
+        self.loaded = True
+
+    def next_game(self, now_utc=None):
+        """Return (game, start time) of the first game starting after now."""
+        self.ensure()
+        now_utc = now_utc or clock.now()
+        i = bisect_right(self.times, now_utc)
+        if i < len(self.games):
+            return self.games[i], self.times[i]
+        return None, None
+
+    def previous_game(self, now_utc=None):
+        """Return (game, start time) of the last game that started before now."""
+        self.ensure()
+        now_utc = now_utc or clock.now()
+        i = bisect_left(self.times, now_utc)
+        if i > 0:
+            return self.games[i - 1], self.times[i - 1]
+        return None, None
+
+    def series_games(self, game, opp_id):
+        """Return games against opp_id from the series start up to and including game's date."""
+        self.ensure()
+        game_date = game.start.date()
+        start_date = game_date - timedelta(days=max(game.series_game - 1, 0))
+        end_date = game_date + timedelta(days=1)
+        lo = bisect_left(self.times, datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc))
+        hi = bisect_left(self.times, datetime(end_date.year, end_date.month, end_date.day, tzinfo=timezone.utc))
+        return [g for g in self.games[lo:hi] if opp_id in (g.home.id, g.away.id)]
+
+SCHEDULE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    team_id INTEGER NOT NULL,
+    game_pk INTEGER NOT NULL,
+    official_date TEXT NOT NULL,
+    start REAL NOT NULL,
+    opponent_id INTEGER NOT NULL,
+    abstract_state TEXT NOT NULL,
+    game TEXT NOT NULL,
+    PRIMARY KEY (team_id, game_pk)
+);
+CREATE INDEX IF NOT EXISTS games_by_start ON games (team_id, start);
+CREATE TABLE IF NOT EXISTS seasons (
+    team_id INTEGER NOT NULL,
+    season INTEGER NOT NULL,
+    loaded REAL NOT NULL,
+    PRIMARY KEY (team_id, season)
+);
+"""
+
+class ScheduleStore:
+    """Full-season schedules of the followed teams in SQLite, so idle lookups are local queries.
+
+    A season is bulk-loaded once (and again every SEASON_RELOAD_DAYS to pick up reschedules).
+    After that only the days around today are re-fetched: every refresh_interval seconds, or
+    on each poll while a game that should be over (GAME_LENGTH after first pitch, or Final in
+    the live data) is still stored without its final score.
+    """
+
+    def __init__(self, path, refresh_interval=SCHEDULE_REFRESH_INTERVAL):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEDULE_SCHEMA)
+        self.refreshed = {}
+        self.refreshing = set()
+
+    def window(self, team_id, game=None):
+        return StoredSchedule(self, team_id, game)
+
+    def refresh(self, team_id, final_pk=None):
+        """Bring team_id's stored schedule up to date, fetching only what may have changed.
+
+        final_pk is a game the live data already shows as final. The fetch runs without the
+        lock, so queries keep answering from the stored rows.
+        """
+        now_utc = clock.now()
+        season = now_utc.year
+        with self.lock:
+            if team_id in self.refreshing:
+                return
+            row = self.db.execute(
+                "SELECT loaded FROM seasons WHERE team_id = ? AND season = ?", (team_id, season)
+            ).fetchone()
+            whole_season = row is None or now_utc.timestamp() - row[0] > SEASON_RELOAD_DAYS * 86400
+            if whole_season:
+                start_date, end_date = f"{season}-01-01", f"{season}-12-31"
+            else:
+                # official_date, not the UTC start: a West-coast night game starts the next UTC day.
+                # A game in progress is left to the live poll until it should be over.
+                unfinished = self.db.execute(
+                    "SELECT MIN(official_date) FROM games "
+                    "WHERE team_id = ? AND start >= ? AND (start <= ? OR game_pk = ?) AND abstract_state != 'Final'",
+                    (
+                        team_id, (now_utc - timedelta(days=SCHEDULE_WINDOW_DAYS)).timestamp(),
+                        now_utc.timestamp() - GAME_LENGTH, final_pk,
+                    ),
+                ).fetchone()[0]
+                last = self.refreshed.get(team_id)
+                if unfinished is None and last is not None and clock.monotonic() - last < self.refresh_interval:
+                    return
+                start_date = str((now_utc - timedelta(days=1)).date())
+                if unfinished is not None:
+                    start_date = min(start_date, unfinished)
+                end_date = str((now_utc + timedelta(days=SCHEDULE_REFRESH_DAYS)).date())
+            self.refreshing.add(team_id)
+        try:
+            rows = self._fetch(team_id, start_date, end_date)
+            with self.lock:
+                # Dropping the range first removes games that were cancelled or moved out of it.
+                self.db.execute(
+                    "DELETE FROM games WHERE team_id = ? AND official_date BETWEEN ? AND ?",
+                    (team_id, start_date, end_date),
+                )
+                self.db.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                if whole_season:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?)", (team_id, season, now_utc.timestamp())
+                    )
+                self.db.commit()
+                self.refreshed[team_id] = clock.monotonic()
+        finally:
+            with self.lock:
+                self.refreshing.discard(team_id)
+
+    def _fetch(self, team_id, start_date, end_date):
+        """Return statsapi's games for team_id dated start_date..end_date as table rows."""
+        # The store decides when to refresh and keeps the games itself, so the response cache
+        # (and with it the checkpoint) never holds a copy of a season's schedule.
+        url = TEAM_SCHEDULE_URL.format(team_id, start_date, end_date)
+        data = get_client().get_json(url, "schedule", cached=False)
+        rows = []
+        for date_entry in data.get("dates", []):
+            for game in date_entry.get("games", []):
+                home_id = game["teams"]["home"]["team"]["id"]
+                away_id = game["teams"]["away"]["team"]["id"]
+                rows.append((
+                    team_id, game["gamePk"], date_entry["date"], parse_game_time(game).timestamp(),
+                    away_id if home_id == team_id else home_id, game["status"]["abstractGameState"], json.dumps(game),
+                ))
+        return rows
+
+    def games(self, team_id, where, params):
+        with self.lock:
+            rows = self.db.execute(f"SELECT game FROM games WHERE team_id = ? AND {where}", (team_id, *params)).fetchall()
+        return [parse_game(json.loads(row[0])) for row in rows]
+
+    def close(self):
+        self.db.close()
+
+class StoredSchedule:
+    """ScheduleWindow's interface answered from a ScheduleStore, refreshed at most once per poll.
+
+    game is this poll's live game, if any; once it is final the store catches up right away.
+    """
+
+    def __init__(self, store, team_id, game=None):
+        self.store = store
+        self.team_id = team_id
+        self.final_pk = game.game_pk if game and (game.abstract_state == "Final" or game.is_final) else None
+        self.loaded = False
+
+    def ensure(self):
+        if not self.loaded:
+            self.store.refresh(self.team_id, self.final_pk)
+            self.loaded = True
+
+    def next_game(self, now_utc=None):
+        """Return (game, start time) of the first game starting after now."""
+        self.ensure()
+        now_utc = now_utc or clock.now()
+        games = self.store.games(self.team_id, "start > ? ORDER BY start LIMIT 1", (now_utc.timestamp(),))
+        return (games[0], games[0].start) if games else (None, None)
+
+    def previous_game(self, now_utc=None):
+        """Return (game, start time) of the last game that started before now."""
+        self.ensure()
+        now_utc = now_utc or clock.now()
+        games = self.store.games(self.team_id, "start < ? ORDER BY start DESC LIMIT 1", (now_utc.timestamp(),))
+        return (games[0], games[0].start) if games else (None, None)
+
+    def series_games(self, game, opp_id):
+        """Return games against opp_id from the series start up to and including game's date."""
+        self.ensure()
+        game_date = game.start.date()
+        start_date = game_date - timedelta(days=max(game.series_game - 1, 0))
+        end_date = game_date + timedelta(days=1)
+        return self.store.games(
+            self.team_id, "opponent_id = ? AND start >= ? AND start < ? ORDER BY start",
+            (
+                opp_id,
+                datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc).timestamp(),
+                datetime(end_date.year, end_date.month, end_date.day, tzinfo=timezone.utc).timestamp(),
+            ),
+        )
+
+_schedule_store = None
+
+def configure_schedule(path, refresh_interval=SCHEDULE_REFRESH_INTERVAL):
+    """Answer schedule lookups from the SQLite season store at path; an empty path fetches windows."""
+    global _schedule_store
+    _schedule_store = None
+    if path:
+        try:
+            _schedule_store = ScheduleStore(path, refresh_interval)
+        except sqlite3.Error as e:
+            print(f"Could not open schedule cache {path}, fetching schedule windows instead:", e)
+    return _schedule_store
+
+def open_schedule(team_id, game=None):
+    """Return this poll's schedule for team_id: a view of the season store, or a window to fetch.
+
+    game is the team's game from this poll's live data, when there is one.
+    """
+    if _schedule_store is not None:
+        return _schedule_store.window(team_id, game)
+    return ScheduleWindow(team_id)
+
+def get_next_game_datetime(window, local_tz, abbr_map):
+    """Return a string describing the team's next scheduled game."""
+    try:
+        next_game, next_game_utc = window.next_game()
 
         if next_game:
-            home_id = next_game["teams"]["home"]["team"]["id"]
-            away_id = next_game["teams"]["away"]["team"]["id"]
-            home_abbr = abbr_map.get(home_id, "???")
-            away_abbr = abbr_map.get(away_id, "???")
-            game_num = int(next_game.get("seriesGameNumber", 0))
-            total_games = int(next_game.get("gamesInSeries", 0))
+            home_abbr = abbr_map.get(next_game.home.id, "???")
+            away_abbr = abbr_map.get(next_game.away.id, "???")
+            game_num = next_game.series_game
+            total_games = next_game.series_total
             local_dt = next_game_utc.astimezone(local_tz)
             tz_abbr = local_dt.strftime("%Z")
-            venue = next_game.get("venue", {}).get("name")
+            venue = next_game.venue
             desc = f"Next game: {away_abbr} vs {home_abbr}"
             if game_num:
                 desc += f" (Game {game_num}{'/' + str(total_games) if total_games else ''})"
@@ -159,48 +1901,25 @@ def get_next_game_datetime(team_id, local_tz, abbr_map):
             if venue:
                 desc += f" • {venue}"
             return desc
-    except RequestException as e:
+    except requests.RequestException as e:
         print("Failed to fetch next game:", e)
     return None
 
-def get_next_game_info(team_id, local_tz, abbr_map):
+def get_next_game_info(window, local_tz, abbr_map):
     """Return info about the next game including records and series status."""
+    team_id = window.team_id
     try:
-        now_utc = datetime.now(timezone.utc)
-        start_date = now_utc.date()
-        end_date = (now_utc + timedelta(days=7)).date()
-        url = (
-            f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId={team_id}"
-            f"&startDate={start_date}&endDate={end_date}"
-        )
-        response = requests.get(url, timeout=10)
-        data = response.json()
-
-        next_game = None
-        next_game_utc = None
-
-        for date_entry in data.get("dates", []):
-            for game in date_entry.get("games", []):
-                game_utc = datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
-                if game_utc <= now_utc:
-                    continue
-                if next_game_utc is None or game_utc < next_game_utc:
-                    next_game = game
-                    next_game_utc = game_utc
+        next_game, next_game_utc = window.next_game()
 
         if next_game:
-            home = next_game["teams"]["home"]
-            away = next_game["teams"]["away"]
-            home_team = home["team"]
-            away_team = away["team"]
-            home_abbr = abbr_map.get(home_team["id"], "???")
-            away_abbr = abbr_map.get(away_team["id"], "???")
+            home_abbr = abbr_map.get(next_game.home.id, "???")
+            away_abbr = abbr_map.get(next_game.away.id, "???")
             local_dt = next_game_utc.astimezone(local_tz)
             tz_abbr = local_dt.strftime("%Z")
-            venue = next_game.get("venue", {}).get("name")
+            venue = next_game.venue
             start_str = f"{local_dt.strftime('%a %H:%M')} {tz_abbr}"
-            series_game = int(next_game.get("seriesGameNumber", 0))
-            series_total = int(next_game.get("gamesInSeries", 0))
+            series_game = next_game.series_game
+            series_total = next_game.series_total
             desc = f"Next game: {away_abbr} vs {home_abbr}"
             if series_game:
                 desc += f" (Game {series_game}{'/' + str(series_total) if series_total else ''})"
@@ -209,115 +1928,64 @@ def get_next_game_info(team_id, local_tz, abbr_map):
                 desc += f" • {venue}"
             series_status = None
             if series_game > 0:
-                series_status = get_series_result(team_id, next_game, abbr_map)
-            opponent = away if home_team["id"] == team_id else home
-            opp_team = opponent["team"]
-            opp_record = opponent.get("leagueRecord", {})
-            main_record = home.get("leagueRecord", {}) if home_team["id"] == team_id else away.get("leagueRecord", {})
+                series_status = get_series_result(window, next_game, abbr_map)
+            main, opponent, _ = next_game.sides(team_id)
             return (
                 desc,
-                opp_team.get("fileCode", abbr_map.get(opp_team["id"], "").lower()),
-                opp_team["id"],
-                opp_team.get("name"),
-                (main_record.get("wins"), main_record.get("losses")),
-                (opp_record.get("wins"), opp_record.get("losses")),
+                opponent.code or abbr_map.get(opponent.id, "").lower(),
+                opponent.id,
+                opponent.name,
+                (main.wins, main.losses),
+                (opponent.wins, opponent.losses),
                 start_str,
                 series_status,
                 series_game,
                 series_total,
             )
-    except RequestException as e:
+    except requests.RequestException as e:
         print("Failed to fetch next game info:", e)
     return None, None, None, None, (None, None), (None, None), None, None, None, None
 
-def get_previous_game_score(team_id, abbr_map):
+def get_previous_game_score(window, abbr_map):
     """Return the last game's score."""
     try:
-        now_utc = datetime.now(timezone.utc)
-        start_date = (now_utc - timedelta(days=7)).date()
-        end_date = now_utc.date()
-        url = (
-            f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId={team_id}"
-            f"&startDate={start_date}&endDate={end_date}"
-        )
-        response = requests.get(url, timeout=10)
-        data = response.json()
-
-        last_game = None
-        last_game_utc = None
-
-        for date_entry in data.get("dates", []):
-            for game in date_entry.get("games", []):
-                game_utc = datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
-                if game_utc >= now_utc:
-                    continue
-                if last_game_utc is None or game_utc > last_game_utc:
-                    last_game = game
-                    last_game_utc = game_utc
+        last_game, _ = window.previous_game()
 
         if last_game:
-            home = last_game["teams"]["home"]
-            away = last_game["teams"]["away"]
-            home_abbr = abbr_map.get(home["team"]["id"], "???")
-            away_abbr = abbr_map.get(away["team"]["id"], "???")
-            home_score = home.get("score", 0)
-            away_score = away.get("score", 0)
+            home_abbr = abbr_map.get(last_game.home.id, "???")
+            away_abbr = abbr_map.get(last_game.away.id, "???")
+            home_score = last_game.home.score if last_game.home.score is not None else 0
+            away_score = last_game.away.score if last_game.away.score is not None else 0
             result = f"Prev: {away_abbr} {away_score} - {home_abbr} {home_score}"
             return result
-    except RequestException as e:
+    except requests.RequestException as e:
         print("Failed to fetch previous game:", e)
     return None
 
-def get_series_result(team_id, game, abbr_map):
+def get_series_result(window, game, abbr_map):
+    team_id = window.team_id
     try:
-        series_game_num = int(game.get("seriesGameNumber", 0))
-        games_in_series = int(game.get("gamesInSeries", 0))
+        series_game_num = game.series_game
+        games_in_series = game.series_total
         if series_game_num <= 1:
             return None
 
-        home = game["teams"]["home"]
-        away = game["teams"]["away"]
-        opponent = away if home["team"]["id"] == team_id else home
-        opp_id = opponent["team"]["id"]
+        _, opponent, _ = game.sides(team_id)
+        opp_id = opponent.id
         opp_abbr = abbr_map.get(opp_id, "???")
 
-        game_date = datetime.fromisoformat(game["gameDate"].replace("Z", "+00:00"))
-        start_date = (game_date - timedelta(days=series_game_num - 1)).date()
-        end_date = game_date.date()
-
-        url = (
-            f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId={team_id}"
-            f"&startDate={start_date}&endDate={end_date}"
-        )
-        response = requests.get(url, timeout=10)
-        data = response.json()
-
         wins = 0
         losses = 0
-        for date_entry in data.get("dates", []):
-            for g in date_entry.get("games", []):
-                h = g["teams"]["home"]
-                a = g["teams"]["away"]
-                if opp_id not in (h["team"]["id"], a["team"]["id"]):
-                    continue
-                if h["team"]["id"] == team_id:
-                    if h.get("isWinner"):
-                        wins += 1
-                    elif a.get("isWinner"):
-                        losses += 1
-                elif a["team"]["id"] == team_id:
-                    if a.get("isWinner"):
-                        wins += 1
-                    elif h.get("isWinner"):
-                        losses += 1
+        for g in window.series_games(game, opp_id):
+            main, other, _ = g.sides(team_id)
+            if main.is_winner:
+                wins += 1
+            elif other.is_winner:
+                losses += 1
         if wins == 0 and losses == 0:
             return None
 
-        concluded = (
-            games_in_series
-            and series_game_num == games_in_series
-            and game["status"].get("detailedState") in ("Final", "Game Over")
-        )
+        concluded = games_in_series and series_game_num == games_in_series and game.is_final
 
         if wins > losses:
             verb = "wins" if concluded else "leads"
@@ -327,90 +1995,165 @@ def get_series_result(team_id, game, abbr_map):
             return f"{opp_abbr} {verb} series {losses}-{wins}"
         else:
             return f"Series tied {wins}-{losses}"
-    except RequestException as e:
+    except requests.RequestException as e:
         print("Failed to fetch series result:", e)
     except Exception as e:
         print("Error getting series result:", e)
     return None
 
-def get_team_record_from_api(team_id):
-    try:
-        season = datetime.now(timezone.utc).year
-        url = (
-            "https://statsapi.mlb.com/api/v1/standings?"
-            f"teamId={team_id}&season={season}&standingsTypes=regularSeason"
-        )
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        for record in data.get("records", []):
-            for team in record.get("teamRecords", []):
-                if team.get("team", {}).get("id") == team_id:
-                    return team.get("wins"), team.get("losses")
-    except RequestException as e:
-        print("Failed to fetch team record:", e)
-    return None, None
+class TeamStanding(Slotted):
+    __slots__ = ("wins", "losses", "games_back", "streak")
+
+class Standings:
+    """Every team's regular-season record, indexed from one league-wide standings request.
+
+    The response is cached like any other (see [cache.ttl] standings). Once a followed game
+    goes final, lookups revalidate it for a while so records move soon after the game.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = None
+        self.teams = {}
+        self.finals = set()
+        self.settle_until = 0
+        self.checked = 0
+
+    def game_final(self, game_pk):
+        with self.lock:
+            if game_pk not in self.finals:
+                self.finals.add(game_pk)
+                self.settle_until = clock.monotonic() + STANDINGS_SETTLE
+                self.checked = 0
+
+    def snapshot(self):
+        """Return {team_id: TeamStanding} for the current season, fetching standings if due."""
+        with self.lock:
+            now = clock.monotonic()
+            revalidate = now < self.settle_until and now - self.checked >= STANDINGS_RECHECK
+            data = get_client().get_json(STANDINGS_URL.format(clock.now().year), "standings", revalidate=revalidate)
+            if revalidate:
+                self.checked = now
+            if data is not self.data:
+                teams = {}
+                for record in data.get("records", []):
+                    for team in record.get("teamRecords", []):
+                        teams[team.get("team", {}).get("id")] = TeamStanding(
+                            wins=team.get("wins"),
+                            losses=team.get("losses"),
+                            games_back=team.get("gamesBack"),
+                            streak=team.get("streak", {}).get("streakCode"),
+                        )
+                self.data = data
+                self.teams = teams
+            return self.teams
+
+    def team(self, team_id):
+        """Return team_id's TeamStanding, or None if it is missing or standings are unreachable."""
+        try:
+            return self.snapshot().get(team_id)
+        except requests.RequestException as e:
+            print("Failed to fetch standings:", e)
+            return None
+
+    def record(self, team_id):
+        """Return (wins, losses) for team_id, or (None, None)."""
+        team = self.team(team_id)
+        return (team.wins, team.losses) if team else (None, None)
+
+_standings = None
 
+def get_standings():
+    global _standings
+    if _standings is None:
+        _standings = Standings()
+    return _standings
 
 def get_team_record(team_id, game=None):
     """Return (wins, losses) using game data if available, else the API."""
-    if game:
+    team = game.team(team_id) if game else None
+    if team and team.wins is not None and team.losses is not None:
+        return team.wins, team.losses
+    return get_standings().record(team_id)
+
+class PlayerIndex:
+    """Player id -> full name for one game, built once from its boxscore."""
+
+    __slots__ = ("names", "roster_size", "stale")
+
+    def __init__(self, boxscore):
+        self.names = {}
+        for side in ("home", "away"):
+            for pdata in boxscore["teams"][side]["players"].values():
+                person = pdata.get("person", {})
+                if person.get("id") is not None:
+                    self.names[person["id"]] = person.get("fullName")
+        self.roster_size = _roster_size(boxscore)
+        self.stale = False
+
+    def lookup(self, player_id):
+        name = self.names.get(player_id)
+        if name is None:
+            # An unknown id means the roster changed; ask for the boxscore again.
+            self.stale = True
+        return name
+
+def _roster_size(boxscore):
+    return tuple(len(boxscore["teams"][side]["players"]) for side in ("home", "away"))
+
+_player_indexes = OrderedDict()
+_player_indexes_lock = threading.Lock()
+
+def player_index(game):
+    """Return the game's PlayerIndex, rebuilding it when its boxscore shows a roster change."""
+    game_pk = game.get("gamePk")
+    boxscore = game.get("boxscore")
+    with _player_indexes_lock:
+        index = _player_indexes.get(game_pk)
         try:
-            for side in ("home", "away"):
-                team = game["teams"][side]
-                if team["team"]["id"] == team_id:
-                    rec = team.get("leagueRecord", {})
-                    wins = rec.get("wins")
-                    losses = rec.get("losses")
-                    if wins is not None and losses is not None:
-                        return wins, losses
-        except KeyError:
+            if boxscore and (index is None or index.stale or index.roster_size != _roster_size(boxscore)):
+                index = PlayerIndex(boxscore)
+                _player_indexes[game_pk] = index
+                _player_indexes.move_to_end(game_pk)
+                while len(_player_indexes) > MAX_PLAYER_INDEXES:
+                    _player_indexes.popitem(last=False)
+        except (KeyError, TypeError, AttributeError):
             pass
-    return get_team_record_from_api(team_id)
+        return index
+
+def has_player_index(game_pk):
+    index = _player_indexes.get(game_pk)
+    return index is not None and not index.stale
+
+def _player_name(game, person):
+    if isinstance(person, dict):
+        name = person.get("fullName")
+        if name:
+            return name
+        person_id = person.get("id")
+    else:
+        person_id = person
+
+    if not person_id:
+        return None
+    index = player_index(game)
+    return index.lookup(person_id) if index else None
 
 def get_pitcher(game, team_id=None):
     """Return the current pitcher's full name if available."""
     try:
-        pitcher = game.get("linescore", {}).get("defense", {}).get("pitcher")
-        if isinstance(pitcher, dict):
-            name = pitcher.get("fullName")
-            if name:
-                return name
-            pitcher_id = pitcher.get("id")
-        else:
-            pitcher_id = pitcher
-
-        if not pitcher_id:
-            return None
-        for side in ["home", "away"]:
-            for pdata in game["boxscore"]["teams"][side]["players"].values():
-                if pdata.get("person", {}).get("id") == pitcher_id:
-                    return pdata.get("person", {}).get("fullName")
+        return _player_name(game, game.get("linescore", {}).get("defense", {}).get("pitcher"))
     except (KeyError, TypeError):
-        pass
-    return None
+        return None
 
 def get_batter(game):
     """Return the current batter's full name if available."""
     try:
-        batter = game.get("linescore", {}).get("offense", {}).get("batter")
-        if isinstance(batter, dict):
-            name = batter.get("fullName")
-            if name:
-                return name
-            batter_id = batter.get("id")
-        else:
-            batter_id = batter
-
-        if not batter_id:
-            return None
-        for side in ["home", "away"]:
-            for pdata in game["boxscore"]["teams"][side]["players"].values():
-                if pdata.get("person", {}).get("id") == batter_id:
-                    return pdata.get("person", {}).get("fullName")
+        return _player_name(game, game.get("linescore", {}).get("offense", {}).get("batter"))
     except (KeyError, TypeError):
-        pass
-    return None
+        return None
 
+@lru_cache(maxsize=256)
 def shorten_name(name):
     """Return player's last name to keep the display concise."""
     try:
@@ -423,50 +2166,44 @@ def shorten_name(name):
         pass
     return name
 
-def build_presence(game, team_info, local_tz, icons, abbr_map):
-    linescore = game.get("linescore", {})
-    home = game["teams"]["home"]
-    away = game["teams"]["away"]
-    status = game["status"]["detailedState"]
-
-    main, opponent = (home, away) if home["team"]["id"] == team_info["id"] else (away, home)
-    is_home = home["team"]["id"] == team_info["id"]
-    main_abbr = main["team"]["abbreviation"]
-    opp_abbr = opponent["team"]["abbreviation"]
-    main_score = main["score"]
-    opp_score = opponent["score"]
-
-    main_w, main_l = get_team_record(main["team"]["id"], game)
-    opp_w, opp_l = get_team_record(opponent["team"]["id"], game)
+def build_presence(game, team_info, local_tz, icons, abbr_map, window):
+    """Return the activity for a GameState of the followed team's current game."""
+    linescore = game.linescore
+    status = game.detailed_state
+
+    main, opponent, is_home = game.sides(team_info["id"])
+    main_abbr = main.abbr or abbr_map.get(main.id, "???")
+    opp_abbr = opponent.abbr or abbr_map.get(opponent.id, "???")
+
+    main_w, main_l = get_team_record(main.id, game)
+    opp_w, opp_l = get_team_record(opponent.id, game)
     main_record = f"{main_w}-{main_l}" if None not in (main_w, main_l) else "N/A"
     opp_record = f"{opp_w}-{opp_l}" if None not in (opp_w, opp_l) else "N/A"
 
-    opponent_logo_url = LOGO_TEMPLATE.format(opponent["team"].get("fileCode", opp_abbr.lower()))
+    opponent_logo_url = LOGO_TEMPLATE.format(opponent.code or opp_abbr.lower())
     team_logo_url = LOGO_TEMPLATE.format(team_info["code"])
 
-    outs = linescore.get("outs", "?")
-    offense = linescore.get("offense", {})
+    outs = linescore.outs if linescore.outs is not None else "?"
     base_status = "".join([
-        icons["filled"] if offense.get("first") else icons["empty"],
-        icons["filled"] if offense.get("second") else icons["empty"],
-        icons["filled"] if offense.get("third") else icons["empty"]
+        icons["filled"] if linescore.first else icons["empty"],
+        icons["filled"] if linescore.second else icons["empty"],
+        icons["filled"] if linescore.third else icons["empty"]
     ])
 
-    inning = linescore.get("currentInning", "?")
-    inning_state = linescore.get("inningState", "")
-    inning_str = f"{inning_state} {ordinal(inning)}" if inning != "?" else "Inning ?"
+    inning = linescore.inning
+    inning_state = linescore.inning_state or ""
+    inning_str = f"{inning_state} {ordinal(inning)}" if inning is not None else "Inning ?"
 
-    pitcher = get_pitcher(game, team_info["id"])
-    batter = get_batter(game)
-    offense_team_id = linescore.get("offense", {}).get("team", {}).get("id")
-    team_is_offense = offense_team_id == team_info["id"]
+    pitcher = linescore.pitcher
+    batter = linescore.batter
+    team_is_offense = linescore.offense_team_id == team_info["id"]
 
-    balls = linescore.get("balls")
-    strikes = linescore.get("strikes")
+    balls = linescore.balls
+    strikes = linescore.strikes
 
     state_parts = []
-    if game["status"]["abstractGameState"] == "Live":
-        live_str = f"{inning_str} | Bases {base_status} | {outs} Out{'s' if outs > 1 else ''}"
+    if game.abstract_state == "Live":
+        live_str = f"{inning_str} | Bases {base_status} | {outs} Out{'s' if outs != '?' and outs > 1 else ''}"
         short_p = shorten_name(pitcher) if pitcher else None
         short_b = shorten_name(batter) if batter else None
 
@@ -496,8 +2233,8 @@ def build_presence(game, team_info, local_tz, icons, abbr_map):
             if show_count:
                 live_str += f" ({balls}-{strikes})"
         state_parts.append(live_str)
-    elif status in ["Final", "Game Over"]:
-        next_game = get_next_game_datetime(team_info["id"], local_tz, abbr_map)
+    elif game.is_final:
+        next_game = get_next_game_datetime(window, local_tz, abbr_map)
         if next_game:
             state_parts.append(next_game)
     else:
@@ -507,25 +2244,29 @@ def build_presence(game, team_info, local_tz, icons, abbr_map):
         else:
             state_parts.append(status)
 
-    details = f"{main_abbr} {main_score} vs {opp_abbr} {opp_score}"
-    if status in ["Final", "Game Over"]:
+    if game.has_score:
+        details = f"{main_abbr} {main.score} vs {opp_abbr} {opponent.score}"
+    else:
+        details = f"{main_abbr} vs {opp_abbr}"
+    if game.is_final:
         details = f"FINAL • {details}"
     series_result = None
-    if game["status"].get("abstractGameState") != "Live":
-        series_result = get_series_result(team_info["id"], game, abbr_map)
+    if game.abstract_state != "Live":
+        series_result = get_series_result(window, game, abbr_map)
     if series_result:
         addition = series_result
-        if game["status"].get("abstractGameState") != "Final" and status not in ["Final", "Game Over"]:
-            game_num = int(game.get("seriesGameNumber", 0))
-            total_games = int(game.get("gamesInSeries", 0))
+        if game.abstract_state != "Final" and not game.is_final:
+            game_num = game.series_game
+            total_games = game.series_total
             if game_num:
                 addition += f" (Game {game_num}{'/' + str(total_games) if total_games else ''})"
-        if status in ["Final", "Game Over"]:
+        if game.is_final:
             details += f" • {addition}"
         else:
             state_parts.append(addition)
 
-    state_str = " • ".join(state_parts)
+    # Discord rejects an activity whose state is under two characters.
+    state_str = " • ".join(state_parts) or ("No upcoming game" if game.is_final else "Game scheduled")
 
     return {
         "details": details,
@@ -533,148 +2274,1183 @@ def build_presence(game, team_info, local_tz, icons, abbr_map):
         "large_image": team_logo_url,
         "large_text": f"{team_info['name']} • {main_record} | {'Home' if is_home else 'Away'}",
         "small_image": opponent_logo_url,
-        "small_text": f"{opponent['team']['name']} • {opp_record} | {'Home' if not is_home else 'Away'}"
+        "small_text": f"{opponent.name} • {opp_record} | {'Home' if not is_home else 'Away'}"
+    }
+
+def build_idle_presence(team_info, window, local_tz, abbr_map, require_next=False, record=(None, None)):
+    """Return the between-games activity: next matchup, previous score and series.
+
+    record is the team's (wins, losses) from standings, used when the schedule has none.
+    """
+    (
+        desc,
+        opp_code,
+        opp_id,
+        opp_name,
+        main_rec,
+        opp_rec,
+        start_str,
+        series_status,
+        series_game,
+        series_total,
+    ) = get_next_game_info(window, local_tz, abbr_map)
+    if require_next and not desc:
+        return None
+    prev = get_previous_game_score(window, abbr_map)
+    logo = LOGO_TEMPLATE.format(team_info["code"])
+    opp_logo = LOGO_TEMPLATE.format(opp_code) if opp_code else None
+    mw, ml = main_rec if None not in main_rec else record
+    main_record = f"{mw}-{ml}" if None not in (mw, ml) else "N/A"
+    ow, ol = opp_rec
+    opp_record = f"{ow}-{ol}" if None not in (ow, ol) else "N/A"
+    state_field = prev or "No recent game"
+    if series_status:
+        state_field += f" • {series_status}"
+    update_data = {
+        "details": desc or "No upcoming game",
+        "state": state_field,
+        "large_image": logo,
+        "large_text": f"{team_info['name']} • {main_record}"
     }
+    if opp_logo:
+        update_data["small_image"] = opp_logo
+    if opp_name:
+        update_data["small_text"] = f"{opp_name} • {opp_record}"
+    return update_data
+
+def render_activity(game, team_info, local_tz, icons, abbr_map, window, live_only=False, record=(None, None)):
+    """Return the activity for one poll, or None when the presence should be cleared."""
+    if game and game.abstract_state == "Final":
+        get_standings().game_final(game.game_pk)
+    if not game:
+        return None if live_only else build_idle_presence(team_info, window, local_tz, abbr_map, record=record)
+    if live_only and game.abstract_state != "Live":
+        return None
+    if not game.has_score:
+        # Pre-game payloads carry no score yet; prefer the countdown to the next game.
+        update_data = build_idle_presence(team_info, window, local_tz, abbr_map, require_next=True, record=record)
+        if update_data:
+            return update_data
+    started = time.perf_counter()
+    activity = build_presence(game, team_info, local_tz, icons, abbr_map, window)
+    metrics.observe("mlb_rpc_render_seconds", time.perf_counter() - started, team=team_info["abbr"])
+    return activity
+
+def needs_idle_data(game, live_only=False):
+    """Return True when this poll renders the between-games view."""
+    return not live_only and (not game or game.abstract_state == "Preview")
+
+class IdleFetcher:
+    """Load the between-games schedule and standings in parallel under one deadline.
+
+    Whatever misses the deadline is replaced by the last result that did arrive.
+    """
+
+    def __init__(self, team_id, deadline=DEFAULT_IDLE_DEADLINE):
+        self.team_id = team_id
+        self.deadline = deadline
+        self.executor = futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="idle-fetch")
+        self.last_window = None
+        self.last_record = (None, None)
+        self.late = 0
+
+    def fetch(self):
+        """Return (window, (wins, losses)) for rendering the idle presence."""
+        window = open_schedule(self.team_id)
+        schedule = self.executor.submit(window.ensure)
+        standings = self.executor.submit(get_standings().record, self.team_id)
+        done, _ = futures.wait((schedule, standings), timeout=self.deadline)
+
+        if schedule in done and schedule.exception() is None:
+            self.last_window = window
+        else:
+            if schedule in done:
+                print("Failed to fetch schedule:", schedule.exception())
+            else:
+                self.late += 1
+                print(f"Schedule did not arrive within {self.deadline}s, using the last one.")
+            if self.last_window is None:
+                # Render from what is already stored (or nothing) rather than block on another fetch.
+                self.last_window = open_schedule(self.team_id)
+                self.last_window.loaded = True
+            window = self.last_window
+        if standings in done and None not in standings.result():
+            self.last_record = standings.result()
+        elif standings not in done:
+            self.late += 1
+        return window, self.last_record
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class PollScheduler:
+    """Choose how long to sleep before the next poll from the state of the game."""
+
+    def __init__(self, refresh, events=False):
+        self.live_interval = refresh.get("live_interval", DEFAULT_LIVE_INTERVAL)
+        self.event_interval = refresh.get("event_interval", DEFAULT_EVENT_INTERVAL)
+        self.events = events
+        self.idle_interval = refresh.get("idle_interval", DEFAULT_IDLE_INTERVAL)
+        self.break_interval = refresh.get("break_interval", DEFAULT_BREAK_INTERVAL)
+        self.delay_interval = refresh.get("delay_interval", DEFAULT_DELAY_INTERVAL)
+        self.pregame_lead = refresh.get("pregame_lead", DEFAULT_PREGAME_LEAD)
+        self.max_idle_sleep = refresh.get("max_idle_sleep", DEFAULT_MAX_IDLE_SLEEP)
+        self.errors = 0
+
+    def after_error(self):
+        """Return an exponentially growing delay for consecutive failed polls."""
+        self.errors += 1
+        return min(ERROR_BACKOFF_BASE * 2 ** (self.errors - 1), ERROR_BACKOFF_MAX)
+
+    def delay(self, game, window=None, now_utc=None):
+        self.errors = 0
+        now_utc = now_utc or clock.now()
+        if game:
+            detailed = game.detailed_state or ""
+            if "Delay" in detailed or "Suspended" in detailed:
+                return self.delay_interval
+            if game.abstract_state == "Live":
+                inning_state = game.linescore.inning_state or ""
+                if inning_state.lower() in ("middle", "end"):
+                    return self.break_interval
+                if self.events and game.at_bat_index is not None:
+                    # Feed diff polls are cheap and usually empty, so ask often during at-bats.
+                    return self.event_interval
+                return self.live_interval
+            if game.abstract_state == "Preview" and game.start:
+                return self.until(game.start, now_utc)
+        next_start = None
+        if window is not None:
+            try:
+                _, next_start = window.next_game(now_utc)
+            except requests.RequestException:
+                pass
+        if next_start is None:
+            return self.idle_interval
+        return self.until(next_start, now_utc)
+
+    def until(self, start_utc, now_utc):
+        """Sleep until pregame_lead before start_utc, then poll at idle_interval until first pitch."""
+        seconds = (start_utc - now_utc).total_seconds()
+        if seconds <= 0:
+            return self.live_interval
+        if seconds <= self.pregame_lead:
+            return min(self.idle_interval, seconds)
+        return min(max(seconds - self.pregame_lead, self.idle_interval), self.max_idle_sleep)
+
+class PresenceState:
+    """Forward activity to Discord only when it changes, staying inside the update rate limit.
+
+    Updates that arrive while the limit is reached are held back; a newer one replaces the
+    held update so the latest state is what eventually gets sent.
+    """
+
+    def __init__(self, rpc, limit=DISCORD_RATE_LIMIT, window=DISCORD_RATE_WINDOW):
+        self.rpc = rpc
+        self.limit = limit
+        self.window = window
+        self.sent_at = deque()
+        self.current_key = None
+        self.current = None
+        self.pending = None
+        self.sent = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.reconnects = 0
+
+    @staticmethod
+    def key(activity):
+        return None if activity is None else hash(tuple(sorted(activity.items())))
+
+    def hold(self, activity):
+        """Queue activity (None clears) as the next state, unless Discord already shows it."""
+        key = self.key(activity)
+        if self.pending is not None:
+            self.coalesced += 1
+        elif (self.sent or self.rejected) and key == self.current_key:
+            self.skipped += 1
+            return False
+        self.pending = (key, activity)
+        return True
+
+    def slot_wait(self, now=None):
+        """Return seconds until another update may be sent."""
+        now = now or clock.monotonic()
+        while self.sent_at and now - self.sent_at[0] >= self.window:
+            self.sent_at.popleft()
+        if len(self.sent_at) < self.limit:
+            return 0
+        return self.window - (now - self.sent_at[0])
+
+    def ready(self):
+        """Return the held (key, activity) if it may be sent now, dropping it if it is a no-op."""
+        if self.pending is None:
+            return None
+        if (self.sent or self.rejected) and self.pending[0] == self.current_key:
+            self.pending = None
+            self.skipped += 1
+            return None
+        if self.slot_wait() > 0:
+            return None
+        return self.pending
+
+    def mark_sent(self, pending, rejected=False):
+        """Record pending as delivered; rejected=True when Discord refused it.
+
+        A rejected activity still takes its rate-limit slot and becomes the current state,
+        so the same payload is not sent again until something else has been shown.
+        """
+        self.sent_at.append(clock.monotonic())
+        if self.pending is pending:
+            self.pending = None
+        self.current_key, self.current = pending
+        if rejected:
+            self.rejected += 1
+        else:
+            self.sent += 1
+
+    def reset(self, rpc):
+        """Use a new connection and re-send the last state unless a newer one is pending."""
+        self.rpc = rpc
+        self.sent_at.clear()
+        if self.pending is None and self.current_key is not None:
+            self.pending = (self.current_key, self.current)
+        self.current_key = None
+        self.current = None
+
+    def summary(self):
+        return (
+            f"Discord: {self.sent} updates sent, {self.skipped} unchanged skipped, {self.coalesced} coalesced, "
+            f"{self.rejected} rejected, {self.reconnects} reconnects"
+        )
+
+def reconnect_delay(attempt):
+    """Return the jittered wait before Discord reconnect attempt (counting from 0).
+
+    The ceiling doubles per failed attempt up to DISCORD_BACKOFF_MAX; the jitter keeps
+    several profiles from retrying a restarted client in lockstep.
+    """
+    ceiling = min(DISCORD_BACKOFF_BASE * 2 ** attempt, DISCORD_BACKOFF_MAX)
+    return random.uniform(ceiling / 2, ceiling)
+
+def open_rpc(client_id, pipe=None):
+    """Make one attempt to connect to the Discord client, raising if it is not reachable."""
+    rpc = pypresence.Presence(client_id, pipe=pipe)
+    rpc.response_timeout = 5
+    try:
+        rpc.connect()
+    except Exception:
+        close_rpc(rpc)
+        raise
+    return rpc
 
-def connect_rpc():
+def close_rpc(rpc):
+    """Drop a pypresence connection and its event loop without talking to Discord."""
+    try:
+        if rpc.sock_writer is not None:
+            rpc.sock_writer.close()
+            rpc.loop.run_until_complete(asyncio.sleep(0))
+        rpc.loop.close()
+    except Exception:
+        pass
+
+class Publisher:
+    """Own one Discord connection on a background thread so polling never waits on Discord.
+
+    The poll loop submits activities without blocking. While Discord is unreachable they only
+    replace one another; once reconnected, the newest state is sent and nothing in between.
+    """
+
+    def __init__(self, client_id, pipe=None, limit=DISCORD_RATE_LIMIT, window=DISCORD_RATE_WINDOW):
+        self.client_id = client_id
+        self.pipe = pipe
+        self.presence = PresenceState(None, limit, window)
+        self.condition = threading.Condition()
+        self.thread = None
+        self.stopped = False
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name=f"discord-ipc-{self.pipe or 0}", daemon=True)
+        self.thread.start()
+
+    def submit(self, activity):
+        """Queue activity (None clears) for Discord, replacing anything not yet sent."""
+        with self.condition:
+            if self.presence.hold(activity):
+                self.condition.notify()
+
+    def run(self):
+        attempt = 0
+        while not self.stopped:
+            if self.presence.rpc is None:
+                try:
+                    rpc = open_rpc(self.client_id, self.pipe)
+                except Exception:
+                    delay = reconnect_delay(attempt)
+                    attempt += 1
+                    print(f"Waiting for Discord... retrying in {delay:.1f}s.")
+                    with self.condition:
+                        self.condition.wait_for(lambda: self.stopped, delay)
+                    continue
+                print("Connected to Discord RPC.")
+                attempt = 0
+                with self.condition:
+                    self.presence.reset(rpc)
+            with self.condition:
+                pending = self.presence.ready()
+                if pending is None:
+                    if self.stopped:
+                        break
+                    self.condition.wait(self.presence.slot_wait() if self.presence.pending is not None else None)
+                    continue
+            rpc = self.presence.rpc
+            started = time.perf_counter()
+            rejected = False
+            try:
+                if pending[1] is None:
+                    rpc.clear()
+                else:
+                    rpc.update(**pending[1])
+            except (pypresence.PipeClosed, pypresence.ResponseTimeout, OSError) as e:
+                # The connection is gone: keep the state pending and send it again on a new one.
+                print("Lost Discord RPC connection:", e or type(e).__name__)
+                metrics.inc("mlb_rpc_discord_reconnects_total")
+                self.presence.reconnects += 1
+                close_rpc(rpc)
+                with self.condition:
+                    self.presence.rpc = None
+                continue
+            except Exception as e:
+                # Discord answered with an error (ServerError, DiscordError, ...): resending the
+                # same payload would only be refused again.
+                print("Discord rejected presence update:", e or type(e).__name__)
+                metrics.inc("mlb_rpc_discord_rejected_total")
+                rejected = True
+            metrics.observe("mlb_rpc_discord_update_seconds", time.perf_counter() - started)
+            with self.condition:
+                self.presence.mark_sent(pending, rejected)
+
+    def close(self):
+        """Stop the thread and clear the presence if Discord is connected."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=10)
+        rpc = self.presence.rpc
+        if rpc is not None:
+            try:
+                rpc.clear()
+            except Exception:
+                pass
+            close_rpc(rpc)
+
+def discord_ipc_path(pipe=0):
+    """Return the Unix socket path pypresence tries first for pipe."""
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if not base:
+        base = f"/run/user/{os.getuid()}"
+        if not os.path.exists(base):
+            base = tempfile.gettempdir()
+    return os.path.join(base, f"discord-ipc-{pipe}")
+
+def make_fake_discord_handler():
+    class FakeDiscordHandler(socketserver.StreamRequestHandler):
+        """Answer the IPC handshake and SET_ACTIVITY frames the way the Discord client does."""
+
+        def send(self, op, payload):
+            data = json.dumps(payload).encode()
+            self.wfile.write(struct.pack("<II", op, len(data)) + data)
+
+        def handle(self):
+            while True:
+                header = self.rfile.read(8)
+                if len(header) < 8:
+                    return
+                op, length = struct.unpack("<II", header)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if op == 0:
+                    self.send(1, {"cmd": "DISPATCH", "evt": "READY", "data": {"v": 1}})
+                elif op == 1:
+                    activity = payload.get("args", {}).get("activity")
+                    short = [field for field in ("details", "state") if len((activity or {}).get(field, "..")) < 2]
+                    if short:
+                        # Discord's own validation: text fields must be 2-128 characters.
+                        message = f'child "activity" fails because child "{short[0]}" length must be at least 2'
+                        print(time.strftime("%H:%M:%S"), "rejected:", message, flush=True)
+                        self.send(1, {
+                            "cmd": payload.get("cmd"), "evt": "ERROR", "nonce": payload.get("nonce"),
+                            "data": {"code": 4000, "message": message},
+                        })
+                        continue
+                    print(time.strftime("%H:%M:%S"), json.dumps(activity) if activity else "(cleared)", flush=True)
+                    self.send(1, {"cmd": payload.get("cmd"), "evt": None, "nonce": payload.get("nonce"), "data": activity})
+                elif op == 3:
+                    self.send(4, payload)
+                else:
+                    return
+
+    return FakeDiscordHandler
+
+def run_fake_discord(pipe):
+    """Stand in for the Discord client on IPC pipe, printing each activity it is sent.
+
+    Restarting it is an easy way to exercise the publisher's reconnects. Unix sockets only.
+    """
+    path = discord_ipc_path(pipe)
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socketserver.ThreadingUnixStreamServer(path, make_fake_discord_handler())
+    server.daemon_threads = True
+    print(f"Fake Discord listening on {path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+def mark_stale(activity, as_of, local_tz):
+    """Return a copy of activity whose state notes it shows the game as of as_of."""
+    stale = dict(activity)
+    note = f"as of {as_of.astimezone(local_tz):%H:%M}"
+    stale["state"] = f"{activity['state']} • {note}"[:128] if activity.get("state") else note
+    return stale
+
+class Checkpoint:
+    """Last game and presence per team plus the response cache, saved for warm restarts.
+
+    The file is replaced atomically, so a crash mid-write leaves the previous checkpoint.
+    """
+
+    def __init__(self, path, cache, interval=CHECKPOINT_INTERVAL):
+        self.path = path
+        self.cache = cache
+        self.interval = interval
+        self.teams = {}
+        self.restored_at = None
+        self.saved_at = None
+        self.dirty = False
+
+    def load(self):
+        """Return the saved checkpoint, or None if there is none or it cannot be read."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if isinstance(saved.get("teams"), dict):
+                return saved
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Ignoring unreadable checkpoint {self.path}:", e)
+        return None
+
+    def restore(self):
+        """Load the saved teams and refill the response cache, so first requests can revalidate."""
+        saved = self.load()
+        if saved is None:
+            return
+        self.restored_at = datetime.fromtimestamp(saved["saved"], timezone.utc)
+        self.cache.restore(saved.get("cache", []), max((clock.now() - self.restored_at).total_seconds(), 0))
+        self.teams = saved["teams"]
+
+    def stale_activity(self, abbr, local_tz):
+        """Return abbr's restored presence marked stale, or None if there is none or it is too old."""
+        entry = self.teams.get(abbr)
+        if self.restored_at is None or not entry or not entry["activity"]:
+            return None
+        if (clock.now() - self.restored_at).total_seconds() > CHECKPOINT_MAX_AGE:
+            return None
+        return mark_stale(entry["activity"], self.restored_at, local_tz)
+
+    def record(self, abbr, game, activity):
+        entry = self.teams.get(abbr)
+        if entry is None or entry["activity"] != activity:
+            self.teams[abbr] = {"game": game.to_dict() if game else None, "activity": activity}
+            self.dirty = True
+
+    def save_due(self):
+        """Save if the presence changed and the last save is at least interval seconds old."""
+        if self.dirty and (self.saved_at is None or clock.monotonic() - self.saved_at >= self.interval):
+            self.save()
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"saved": clock.now().timestamp(), "teams": self.teams, "cache": self.cache.dump()}, f)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not write checkpoint {self.path}:", e)
+        self.saved_at = clock.monotonic()
+        self.dirty = False
+
+class Follower:
+    """One profile: a followed team, how to render it, and its Discord presence."""
+
+    def __init__(self, profile, team_info, icons, abbr_map, idle_deadline=DEFAULT_IDLE_DEADLINE, events_only=False):
+        self.team_info = team_info
+        self.local_tz = profile["timezone"]
+        self.live_only = profile["live_only"]
+        self.client_id = profile["client_id"]
+        self.pipe = profile["pipe"]
+        self.icons = icons
+        self.abbr_map = abbr_map
+        self.idle = IdleFetcher(team_info["id"], idle_deadline)
+        self.publisher = Publisher(self.client_id, self.pipe)
+        self.presence = self.publisher.presence
+        self.events_only = events_only
+        self.last_game = None
+        self.checkpoint = None
+        self.shown = None
+        self.shown_at = None
+
+    def unchanged(self, game):
+        """In events_only mode, return True when a live game shows nothing new since the last poll."""
+        if not self.events_only:
+            return False
+        previous, self.last_game = self.last_game, game
+        if game is None or game.abstract_state != "Live" or previous is None or previous.abstract_state != "Live":
+            return False
+        events = game_events(previous, game)
+        for event in events:
+            metrics.inc("mlb_rpc_live_events_total", event=event, team=self.team_info["abbr"])
+        if not events:
+            metrics.inc("mlb_rpc_renders_skipped_total", team=self.team_info["abbr"])
+            # The presence on show was just confirmed current.
+            self.shown_at = clock.now()
+        return not events
+
+    def render(self, game):
+        """Return (activity, window) for this poll; activity None clears the presence."""
+        window = open_schedule(self.team_info["id"], game)
+        record = (None, None)
+        if needs_idle_data(game, self.live_only):
+            window, record = self.idle.fetch()
+        activity = render_activity(
+            game, self.team_info, self.local_tz, self.icons, self.abbr_map, window, self.live_only, record
+        )
+        return activity, window
+
+    def publish(self, game):
+        """Render game and hand it to Discord, returning the window used."""
+        activity, window = self.render(game)
+        self.publisher.submit(activity)
+        self.rendered(game, activity)
+        return window
+
+    def rendered(self, game, activity):
+        """Note a presence rendered from fresh data, for stale_activity() and the checkpoint."""
+        self.shown = activity
+        self.shown_at = clock.now()
+        if self.checkpoint is not None:
+            self.checkpoint.record(self.team_info["abbr"], game, activity)
+
+    def stale_activity(self):
+        """Return the last fresh presence marked with its age, to show while statsapi is failing.
+
+        Also forgets last_game, so the next successful poll re-renders and drops the age
+        even in events_only mode, where an unchanged game would otherwise skip rendering.
+        """
+        self.last_game = None
+        if self.shown is None:
+            return None
+        return mark_stale(self.shown, self.shown_at, self.local_tz)
+
+def put_latest(queue, item):
+    """Put item on a size-1 queue, replacing anything the consumer has not taken yet."""
+    if queue.full():
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(item)
+
+def _missing_record_ids(game):
+    if not game:
+        return []
+    return [team.id for team in (game.home, game.away) if team.wins is None or team.losses is None]
+
+async def fetch_loop(source, team_id, scheduler, idle, live_only, render_queue, unchanged=None):
+    """Poll statsapi and hand (game, window, record) snapshots to the renderer, or None when a poll fails.
+
+    unchanged(game) returning True skips the snapshot (see Follower.unchanged).
+    """
+    while True:
+        try:
+            game = await asyncio.to_thread(source.fetch)
+            if unchanged is not None and unchanged(game):
+                await asyncio.sleep(scheduler.delay(game))
+                continue
+            record = (None, None)
+            if needs_idle_data(game, live_only):
+                window, record = await asyncio.to_thread(idle.fetch)
+            else:
+                # A fresh window per tick keeps the renderer's snapshot consistent while the
+                # next one is being fetched. Schedule and standings load concurrently; a live
+                # game's presence does not read the schedule, so it is only loaded once it ends.
+                window = open_schedule(team_id, game)
+                jobs = []
+                if game is None or game.abstract_state != "Live":
+                    jobs.append(asyncio.to_thread(window.ensure))
+                if _missing_record_ids(game):
+                    jobs.append(asyncio.to_thread(get_standings().snapshot))
+                for result in await asyncio.gather(*jobs, return_exceptions=True):
+                    if isinstance(result, requests.RequestException):
+                        print("Failed to fetch schedule or standings:", result)
+            put_latest(render_queue, (game, window, record))
+            delay = await asyncio.to_thread(scheduler.delay, game, window)
+        except requests.RequestException as e:
+            print("Failed to fetch live game:", e)
+            put_latest(render_queue, None)
+            delay = scheduler.after_error()
+        except Exception as e:
+            # A truncated body or an odd payload must not end the task (and with it run_async).
+            print("Unexpected error:", e)
+            metrics.inc("mlb_rpc_poll_errors_total", stage="other")
+            delay = scheduler.after_error()
+        await asyncio.sleep(delay)
+
+async def render_loop(follower, render_queue, publish_queue):
+    """Turn fetched snapshots into activities for the publisher."""
     while True:
+        snapshot = await render_queue.get()
+        if snapshot is None:
+            # The fetch failed: keep showing the last presence, with its age.
+            stale = follower.stale_activity()
+            if stale is not None:
+                put_latest(publish_queue, stale)
+            continue
+        game, window, record = snapshot
         try:
-            rpc = Presence(CLIENT_ID)
+            activity = await asyncio.to_thread(
+                render_activity, game, follower.team_info, follower.local_tz, follower.icons,
+                follower.abbr_map, window, follower.live_only, record
+            )
+        except Exception as e:
+            print("Unexpected error:", e)
+            continue
+        put_latest(publish_queue, activity)
+        follower.rendered(game, activity)
+        if follower.checkpoint is not None:
+            await asyncio.to_thread(follower.checkpoint.save_due)
+
+async def connect_aio_rpc(client_id, pipe=None):
+    attempt = 0
+    while True:
+        try:
+            rpc = pypresence.AioPresence(client_id, pipe=pipe)
             rpc.response_timeout = 5
-            rpc.connect()
+            await rpc.connect()
             print("Connected to Discord RPC.")
             return rpc
         except Exception:
-            print("Waiting for Discord... retrying in 5s.")
-            time.sleep(5)
+            delay = reconnect_delay(attempt)
+            attempt += 1
+            print(f"Waiting for Discord... retrying in {delay:.1f}s.")
+            await asyncio.sleep(delay)
+
+async def publish_loop(presence, publish_queue, client_id=None, pipe=None):
+    """Own the Discord connection and send the newest activity within the rate limit."""
+    try:
+        while True:
+            if presence.rpc is None:
+                presence.reset(await connect_aio_rpc(client_id, pipe))
+            if presence.pending is None:
+                presence.hold(await publish_queue.get())
+                continue
+            pending = presence.ready()
+            if pending is not None:
+                started = time.perf_counter()
+                rejected = False
+                try:
+                    if pending[1] is None:
+                        await presence.rpc.clear()
+                    else:
+                        await presence.rpc.update(**pending[1])
+                except (pypresence.PipeClosed, pypresence.ResponseTimeout, OSError) as e:
+                    print("Lost Discord RPC connection:", e or type(e).__name__)
+                    metrics.inc("mlb_rpc_discord_reconnects_total")
+                    presence.reconnects += 1
+                    presence.rpc = None
+                    continue
+                except Exception as e:
+                    # Same as Publisher.run: a refused payload is dropped, not retried.
+                    print("Discord rejected presence update:", e or type(e).__name__)
+                    metrics.inc("mlb_rpc_discord_rejected_total")
+                    rejected = True
+                metrics.observe("mlb_rpc_discord_update_seconds", time.perf_counter() - started)
+                presence.mark_sent(pending, rejected)
+            elif presence.pending is not None:
+                try:
+                    presence.hold(await asyncio.wait_for(publish_queue.get(), presence.slot_wait()))
+                except asyncio.TimeoutError:
+                    pass
+    finally:
+        if presence.rpc is not None:
+            try:
+                await presence.rpc.clear()
+            except Exception:
+                pass
+
+async def run_async(source, follower, scheduler):
+    """Run fetching, rendering and publishing for one follower as separate tasks until cancelled."""
+    render_queue = asyncio.Queue(maxsize=1)
+    publish_queue = asyncio.Queue(maxsize=1)
+    if follower.checkpoint is not None:
+        stale = follower.checkpoint.stale_activity(follower.team_info["abbr"], follower.local_tz)
+        if stale is not None:
+            put_latest(publish_queue, stale)
+    tasks = [
+        asyncio.create_task(fetch_loop(
+            source, follower.team_info["id"], scheduler, follower.idle, follower.live_only, render_queue,
+            follower.unchanged,
+        )),
+        asyncio.create_task(render_loop(follower, render_queue, publish_queue)),
+        asyncio.create_task(publish_loop(follower.presence, publish_queue, follower.client_id, follower.pipe)),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+class StateHub:
+    """Latest normalized game and rendered activity per team, shared with subscribers."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.version = 0
+        self.teams = {}
+
+    def publish(self, abbr, game, activity):
+        game = game.to_dict() if game else None
+        with self.condition:
+            current = self.teams.get(abbr)
+            if current and current["game"] == game and current["activity"] == activity:
+                return
+            self.version += 1
+            self.teams[abbr] = {
+                "game": game,
+                "activity": activity,
+                "version": self.version,
+                "updated": int(time.time()),
+            }
+            self.condition.notify_all()
+
+    def snapshot(self, since=0, wait=0, team=None):
+        """Return the state once its version passes since, or after wait seconds."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version > since, timeout=wait)
+            teams = self.teams if team is None else {k: v for k, v in self.teams.items() if k == team}
+            return {"version": self.version, "teams": dict(teams)}
+
+def make_metrics_handler():
+    """Return a handler serving the poll loop's metrics at /metrics (Prometheus text) and /metrics.json."""
+    class MetricsHandler(http_server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = urlparse(self.path).path
+            if path == "/metrics":
+                body = metrics.prometheus().encode()
+                content_type = "text/plain; version=0.0.4"
+            elif path == "/metrics.json":
+                body = json.dumps(metrics.to_dict()).encode()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+def start_metrics_server(listen):
+    server = http_server.ThreadingHTTPServer(parse_listen(listen, DEFAULT_METRICS_PORT), make_metrics_handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving metrics on http://{server.server_address[0]}:{server.server_address[1]}/metrics")
+    return server
+
+def write_metrics(path):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"time": int(time.time()), **metrics.to_dict()}, f)
+    os.replace(tmp, path)
+
+def start_metrics_dump(path, interval=DEFAULT_METRICS_DUMP_INTERVAL):
+    """Rewrite path with a JSON snapshot of the metrics every interval seconds and on exit."""
+    def dump_forever():
+        while True:
+            time.sleep(interval)
+            try:
+                write_metrics(path)
+            except OSError as e:
+                print("Failed to write metrics:", e)
+
+    threading.Thread(target=dump_forever, daemon=True).start()
+    atexit.register(write_metrics, path)
+
+class TickProfiler:
+    """Profiles the work (not the sleeps) of the first `ticks` poll-loop iterations with cProfile.
+
+    Does nothing when path is None. Only the polling thread is profiled.
+    """
+
+    def __init__(self, path=None, ticks=DEFAULT_PROFILE_TICKS):
+        self.path = path
+        self.ticks = ticks
+        self.done = 0
+        self.profile = cProfile.Profile() if path else None
+
+    def begin(self):
+        if self.profile is not None:
+            self.profile.enable()
+
+    def end(self):
+        if self.profile is None:
+            return
+        self.profile.disable()
+        self.done += 1
+        if self.done >= self.ticks:
+            self.profile.dump_stats(self.path)
+            print(f"Wrote a {self.done}-tick profile to {self.path} (view it with python -m pstats {self.path}).")
+            self.profile = None
+
+def make_state_handler(hub):
+    class StateHandler(make_metrics_handler()):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/state":
+                super().do_GET()
+                return
+            query = parse_qs(url.query)
+            try:
+                since = int(query.get("since", ["0"])[0])
+                wait = min(float(query.get("wait", ["0"])[0]), 60)
+            except ValueError:
+                self.send_error(400)
+                return
+            team = query.get("team", [None])[0]
+            body = json.dumps(hub.snapshot(since, wait, team.upper() if team else None)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StateHandler
+
+def parse_listen(value, default_port=DEFAULT_SERVER_PORT):
+    host, _, port = str(value).rpartition(":")
+    return host or "127.0.0.1", int(port or default_port)
+
+def run_server(listen, source, followers, scheduler, profiler=None):
+    """Poll statsapi once for every follower and serve the results at /state instead of Discord."""
+    profiler = profiler or TickProfiler()
+    hub = StateHub()
+    server = http_server.ThreadingHTTPServer(parse_listen(listen), make_state_handler(hub))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving game state on http://{server.server_address[0]}:{server.server_address[1]}/state")
+    try:
+        while True:
+            started = time.perf_counter()
+            profiler.begin()
+            try:
+                games = source.fetch_all()
+                delays = []
+                for follower in followers:
+                    game = games.get(follower.team_info["id"])
+                    try:
+                        if follower.unchanged(game):
+                            delays.append(scheduler.delay(game))
+                            continue
+                        activity, window = follower.render(game)
+                        hub.publish(follower.team_info["abbr"], game, activity)
+                        delays.append(scheduler.delay(game, window))
+                    except Exception as e:
+                        print(f"Unexpected error rendering {follower.team_info['abbr']}:", e)
+                        metrics.inc("mlb_rpc_poll_errors_total", stage="render")
+                        delays.append(ERROR_BACKOFF_BASE)
+                delay = min(delays)
+            except requests.RequestException as e:
+                print("Failed to fetch live game:", e)
+                metrics.inc("mlb_rpc_poll_errors_total", stage="fetch")
+                delay = scheduler.after_error()
+            profiler.end()
+            metrics.observe("mlb_rpc_tick_seconds", time.perf_counter() - started)
+            clock.sleep(delay)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def run_subscriber(url, profile):
+    """Mirror a --serve instance's presence for one team to Discord without polling statsapi."""
+    abbr = profile["team"]
+    publisher = Publisher(profile["client_id"], profile["pipe"])
+    publisher.start()
+    session = requests.Session()
+    since = 0
+    errors = 0
+    while True:
+        try:
+            response = session.get(
+                f"{url.rstrip('/')}/state",
+                params={"team": abbr, "since": since, "wait": SUBSCRIBE_WAIT},
+                timeout=SUBSCRIBE_WAIT + 10,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            errors += 1
+            print(f"Failed to reach {url}:", e)
+            time.sleep(min(ERROR_BACKOFF_BASE * 2 ** (errors - 1), ERROR_BACKOFF_MAX))
+            continue
+        errors = 0
+        if data["version"] < since:
+            # The server restarted; start over from its current state.
+            since = 0
+            continue
+        since = data["version"]
+        entry = data["teams"].get(abbr)
+        if entry is None:
+            print(f"{url} is not following {abbr}.")
+        game = entry["game"] if entry else None
+        activity = entry["activity"] if entry else None
+        if profile["live_only"] and (not game or game["abstract_state"] != "Live"):
+            activity = None
+        publisher.submit(activity)
+
+def benchmark_replay(adapter, duration, source, followers, scheduler):
+    """Run the poll loop over a replayed archive without sleeping or Discord and print what it cost."""
+    client = get_client()
+    keys = {}
+    game_pks = set()
+    updates = 0
+    latencies = []
+    while clock.elapsed() <= duration:
+        started = time.perf_counter()
+        try:
+            games = source.fetch_all()
+            delays = []
+            for follower in followers:
+                game = games.get(follower.team_info["id"])
+                activity, window = follower.render(game)
+                key = PresenceState.key(activity)
+                if keys.get(follower.team_info["abbr"], 0) != key:
+                    keys[follower.team_info["abbr"]] = key
+                    updates += 1
+                if game and game.abstract_state == "Live":
+                    game_pks.add(game.game_pk)
+                delays.append(scheduler.delay(game, window))
+            delay = min(delays)
+        except requests.RequestException as e:
+            print("Failed to fetch live game:", e)
+            delay = scheduler.after_error()
+        latencies.append(time.perf_counter() - started)
+        clock.sleep(delay)
+
+    latencies.sort()
+    ticks = len(latencies)
+    per_game = f"{client.requests / len(game_pks):.1f} per live game" if game_pks else "no live games"
+    print(
+        f"Ticks: {ticks} over {duration / 60:.1f} simulated min; latency "
+        f"median {latencies[ticks // 2] * 1000:.2f} ms, p95 {latencies[int(ticks * 0.95)] * 1000:.2f} ms, "
+        f"max {latencies[-1] * 1000:.2f} ms"
+    )
+    print(f"Requests: {client.requests} ({per_game}), {adapter.misses} not in the archive")
+    print(f"Rendered presence updates: {updates}")
+
+def print_summaries(client, source, followers, live_feed):
+    print(client.summary())
+    for follower in followers:
+        print(f"{follower.team_info['abbr']} {follower.presence.summary()}")
+    if live_feed:
+        print(source.summary())
 
 def main():
     config = load_config()
-    team_abbr, local_tz, live_only = parse_args(config)
+    args = parse_args(config)
+    if args.fake_discord is not None:
+        run_fake_discord(args.fake_discord)
+        return
+    client_id = load_client_id()
+    subscribe = args.subscribe or config.get("subscribe")
+    listen = args.serve or config.get("server", {}).get("listen")
+    offline_tools = args.compare_live or args.bench_decode or args.bench_replay
+    if not client_id and (subscribe or not (listen or offline_tools)):
+        print("CLIENT_ID is not set. Please add it to your .env file.")
+        sys.exit(1)
+    profiles = build_profiles(config, args, client_id)
+
+    if subscribe:
+        resolve_imports(requests, pypresence, asyncio)
+        threads = [
+            threading.Thread(target=run_subscriber, args=(subscribe, profile), daemon=True)
+            for profile in profiles
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while any(thread.is_alive() for thread in threads):
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\nStopped cleanly.")
+        return
+
+    client = configure_client(config)
+    replay_path = args.bench_replay or args.replay
+    if replay_path:
+        replay = start_replay(replay_path, 0 if args.bench_replay else args.speed)
+    elif args.record:
+        client.recorder = FixtureRecorder(args.record)
+    # Replays must see the archived schedule requests, not a season stored from earlier runs.
+    configure_schedule(
+        None if replay_path else config.get("schedule_cache", SCHEDULE_CACHE_FILE),
+        config.get("refresh", {}).get("schedule_interval", SCHEDULE_REFRESH_INTERVAL),
+    )
+    checkpoint_path = None if replay_path else config.get("checkpoint", CHECKPOINT_FILE)
+    checkpoint = Checkpoint(checkpoint_path, client.cache) if checkpoint_path else None
+    if checkpoint is not None:
+        checkpoint.restore()
+
+    metrics_config = config.get("metrics", {})
+    metrics_listen = args.metrics or metrics_config.get("listen")
+    if metrics_listen:
+        start_metrics_server(metrics_listen)
+    if metrics_config.get("dump"):
+        start_metrics_dump(metrics_config["dump"], metrics_config.get("dump_interval", DEFAULT_METRICS_DUMP_INTERVAL))
+    profiler = TickProfiler(args.profile, args.profile_ticks)
 
     icons = {
         "filled": config.get("display", {}).get("base_icon_filled", DEFAULT_BASE_ICON_FILLED),
         "empty": config.get("display", {}).get("base_icon_empty", DEFAULT_BASE_ICON_EMPTY)
     }
 
-    live_interval = config.get("refresh", {}).get("live_interval", DEFAULT_LIVE_INTERVAL)
-    idle_interval = config.get("refresh", {}).get("idle_interval", DEFAULT_IDLE_INTERVAL)
+    live_events = args.live_events or config.get("live_events", False)
+    scheduler = PollScheduler(config.get("refresh", {}), live_events)
+    idle_deadline = config.get("refresh", {}).get("idle_deadline", DEFAULT_IDLE_DEADLINE)
+    live_query = config.get("live_query", "team")
+    # Play-level events come from the GUMBO feed, so event mode implies it.
+    live_feed = args.live_feed or config.get("live_feed", False) or live_events
+
+    team_index = load_team_index(config.get("team_cache", TEAM_CACHE_FILE))
+    abbr_map = get_team_abbr_map(team_index)
+    followers = []
+    for profile in profiles:
+        team_info = fetch_team_info(profile["team"], team_index)
+        if not team_info:
+            print(f"Invalid team abbreviation: {profile['team']}")
+            return
+        followers.append(Follower(profile, team_info, icons, abbr_map, idle_deadline, live_events))
+        followers[-1].checkpoint = checkpoint
+
+    if args.compare_live:
+        compare_live_queries(followers[0].team_info["id"])
+        return
+    if args.bench_decode:
+        benchmark_decoders(followers[0].team_info["id"])
+        return
 
-    abbr_map = get_team_abbr_map()
-    team_info = fetch_team_info(team_abbr)
-    if not team_info:
-        print(f"Invalid team abbreviation: {team_abbr}")
+    live_parse = config.get("live_parse", "full")
+    source = LiveSource([follower.team_info["id"] for follower in followers], live_query, live_feed, live_parse)
+
+    if args.bench_replay:
+        benchmark_replay(*replay, source, followers, scheduler)
+        return
+
+    if listen:
+        try:
+            run_server(listen, source, followers, scheduler, profiler)
+        except KeyboardInterrupt:
+            print("\nStopped cleanly.")
+            print(client.summary())
+        finally:
+            for follower in followers:
+                follower.idle.close()
+        return
+
+    if args.async_runtime or config.get("async_runtime", False):
+        if len(followers) > 1:
+            print("The asyncio runtime follows a single team; run one process per team or drop --async.")
+            return
+        try:
+            asyncio.run(run_async(source, followers[0], scheduler))
+        except KeyboardInterrupt:
+            print("\nStopped cleanly.")
+            print_summaries(client, source, followers, live_feed)
+        finally:
+            followers[0].idle.close()
+            if checkpoint is not None:
+                checkpoint.save()
         return
 
-    rpc = connect_rpc()
+    # Publisher threads open pypresence (and through it asyncio) on their own.
+    resolve_imports(pypresence, asyncio)
+    for follower in followers:
+        follower.publisher.start()
+        stale = checkpoint.stale_activity(follower.team_info["abbr"], follower.local_tz) if checkpoint else None
+        if stale is not None:
+            follower.publisher.submit(stale)
 
     try:
         while True:
+            started = time.perf_counter()
+            profiler.begin()
             try:
-                game = fetch_live_game(team_info["id"])
-
-                if game:
-                    abstract_state = game["status"]["abstractGameState"]
-                    if live_only and abstract_state != "Live":
-                        rpc.clear()
-                        time.sleep(idle_interval)
-                        continue
+                games = source.fetch_all()
+                delays = []
+                for follower in followers:
+                    game = games.get(follower.team_info["id"])
                     try:
-                        activity = build_presence(game, team_info, local_tz, icons, abbr_map)
-                    except KeyError as e:
-                        if str(e) == "'score'":
-                            (
-                                desc,
-                                opp_code,
-                                opp_id,
-                                opp_name,
-                                main_rec,
-                                opp_rec,
-                                start_str,
-                                series_status,
-                                series_game,
-                                series_total,
-                            ) = get_next_game_info(team_info["id"], local_tz, abbr_map)
-                            if desc:
-                                prev = get_previous_game_score(team_info["id"], abbr_map)
-                                logo = LOGO_TEMPLATE.format(team_info["code"])
-                                opp_logo = LOGO_TEMPLATE.format(opp_code) if opp_code else None
-                                mw, ml = main_rec
-                                main_record = f"{mw}-{ml}" if None not in (mw, ml) else "N/A"
-                                ow, ol = opp_rec
-                                opp_record = f"{ow}-{ol}" if None not in (ow, ol) else "N/A"
-                                state_field = prev or "No recent game"
-                                if series_status:
-                                    state_field += f" • {series_status}"
-                                details_field = desc
-                                update_data = {
-                                    "details": details_field,
-                                    "state": state_field,
-                                    "large_image": logo,
-                                    "large_text": f"{team_info['name']} • {main_record}"
-                                }
-                                if opp_logo:
-                                    update_data["small_image"] = opp_logo
-                                if opp_name:
-                                    update_data["small_text"] = f"{opp_name} • {opp_record}"
-                                rpc.update(**update_data)
-                                time.sleep(idle_interval)
-                                continue
-                        raise
-                    rpc.update(**activity)
-                    time.sleep(live_interval if abstract_state == "Live" else idle_interval)
-                else:
-                    if live_only:
-                        rpc.clear()
-                    else:
-                        (
-                            desc,
-                            opp_code,
-                            opp_id,
-                            opp_name,
-                            main_rec,
-                            opp_rec,
-                            start_str,
-                            series_status,
-                            series_game,
-                            series_total,
-                        ) = get_next_game_info(team_info["id"], local_tz, abbr_map)
-                        prev = get_previous_game_score(team_info["id"], abbr_map)
-                        logo = LOGO_TEMPLATE.format(team_info['code'])
-                        opp_logo = LOGO_TEMPLATE.format(opp_code) if opp_code else None
-                        mw, ml = main_rec
-                        main_record = f"{mw}-{ml}" if None not in (mw, ml) else "N/A"
-                        ow, ol = opp_rec
-                        opp_record = f"{ow}-{ol}" if None not in (ow, ol) else "N/A"
-                        state_field = prev or "No recent game"
-                        if series_status:
-                            state_field += f" • {series_status}"
-                        details_field = desc or "No upcoming game"
-                        update_data = {
-                            "details": details_field,
-                            "state": state_field,
-                            "large_image": logo,
-                            "large_text": f"{team_info['name']} • {main_record}"
-                        }
-                        if opp_logo:
-                            update_data["small_image"] = opp_logo
-                        if opp_name:
-                            update_data["small_text"] = f"{opp_name} • {opp_record}"
-                        rpc.update(**update_data)
-                    time.sleep(idle_interval)
-
-            except PipeClosed:
-                print("Lost Discord RPC connection. Reconnecting...")
-                rpc = connect_rpc()
+                        if follower.unchanged(game):
+                            delays.append(scheduler.delay(game))
+                            continue
+                        window = follower.publish(game)
+                        delays.append(scheduler.delay(game, window))
+                    except Exception as e:
+                        print(f"Unexpected error rendering {follower.team_info['abbr']}:", e)
+                        metrics.inc("mlb_rpc_poll_errors_total", stage="render")
+                        delays.append(ERROR_BACKOFF_BASE)
+                delay = min(delays)
+
+            except requests.RequestException as e:
+                print("Failed to fetch live game:", e)
+                metrics.inc("mlb_rpc_poll_errors_total", stage="fetch")
+                delay = scheduler.after_error()
+                for follower in followers:
+                    stale = follower.stale_activity()
+                    if stale is not None:
+                        follower.publisher.submit(stale)
             except Exception as e:
                 print("Unexpected error:", e)
-                time.sleep(5)
+                metrics.inc("mlb_rpc_poll_errors_total", stage="other")
+                delay = scheduler.after_error()
+            profiler.end()
+            metrics.observe("mlb_rpc_tick_seconds", time.perf_counter() - started)
+            if checkpoint is not None:
+                checkpoint.save_due()
+            clock.sleep(delay)
     except KeyboardInterrupt:
         print("\nStopped cleanly.")
-        try:
-            rpc.clear()
-        except:
-            pass
+        print_summaries(client, source, followers, live_feed)
+    finally:
+        for follower in followers:
+            follower.publisher.close()
+            follower.idle.close()
+        if checkpoint is not None:
+            checkpoint.save()
 
 if __name__ == "__main__":
     main()
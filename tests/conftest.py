@@ -0,0 +1,27 @@
+import importlib.util
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "mlb-discord-rpc.py"
+# One TOR-NYY game: preview, nine innings of live polls, final and the next day's schedule.
+# Recorded with --record's FixtureRecorder against a scripted statsapi stand-in.
+GAME_ARCHIVE = Path(__file__).resolve().parent / "fixtures" / "tor-nyy-2026-06-01.jsonl.gz"
+
+
+@pytest.fixture
+def rpc(monkeypatch, tmp_path):
+    """A freshly executed mlb-discord-rpc module, so its clock, client and stores start clean."""
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("mlb_discord_rpc", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def replay_clock(rpc):
+    """Install a ReplayClock that only moves when slept on or advanced by hand."""
+    rpc.clock = rpc.ReplayClock(datetime(2026, 6, 1, 22, 30, tzinfo=timezone.utc))
+    return rpc.clock
@@ -0,0 +1,106 @@
+import pytest
+import requests
+
+
+def json_response(body=b"{}", status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+def test_breaker_opens_probes_and_closes(rpc, replay_clock):
+    breaker = rpc.CircuitBreaker(failures=2, cooldown=30, max_cooldown=100)
+    assert not breaker.failure()
+    assert breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    replay_clock.sleep(30)
+    assert breaker.allow() and breaker.state == "half-open"
+    assert not breaker.allow()
+    assert breaker.failure()
+    assert breaker.cooldown == 60 and not breaker.allow()
+
+    replay_clock.sleep(60)
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed" and breaker.cooldown == 30
+
+
+def test_cancelled_probe_lets_the_next_request_probe(rpc, replay_clock):
+    breaker = rpc.CircuitBreaker(failures=1, cooldown=10)
+    breaker.failure()
+    replay_clock.sleep(10)
+    assert breaker.allow()
+    breaker.cancel()
+    assert breaker.state == "open"
+    assert breaker.allow()
+
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ChunkedEncodingError("IncompleteRead"),
+    requests.exceptions.ContentDecodingError("bad gzip"),
+    requests.exceptions.TooManyRedirects("loop"),
+])
+def test_any_failed_probe_settles_the_breaker(rpc, replay_clock, monkeypatch, error):
+    client = rpc.StatsClient(breaker={"failures": 1, "cooldown": 10})
+
+    def fail(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(client.session, "get", fail)
+    with pytest.raises(type(error)):
+        client.get("/api/v1/schedule/games/", "live")
+    breaker = client.breaker("live")
+    assert breaker.state == "open"
+
+    replay_clock.sleep(10)
+    with pytest.raises(type(error)):
+        client.get("/api/v1/schedule/games/", "live")
+    assert breaker.state == "open"
+
+    monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: json_response())
+    replay_clock.sleep(20)
+    assert client.get("/api/v1/schedule/games/", "live").status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_governor_keeps_a_reserve_for_live_polls(rpc, replay_clock):
+    governor = rpc.RequestGovernor(per_minute=4, reserve=0.5, max_wait=0)
+    assert governor.acquire("schedule")
+    assert governor.acquire("standings")
+    assert not governor.acquire("schedule")
+    assert governor.acquire("live")
+    assert governor.acquire("live")
+    assert not governor.acquire("live")
+    assert governor.stats()["dropped"] == 2
+
+    replay_clock.sleep(60)
+    assert governor.acquire("schedule")
+
+
+def test_live_polls_wait_for_a_token(rpc, replay_clock):
+    governor = rpc.RequestGovernor(per_minute=1, max_wait=90)
+    assert governor.acquire("live")
+    assert governor.acquire("live")
+    assert replay_clock.monotonic() == pytest.approx(60)
+    assert governor.deferred == 1
+
+
+def test_token_buckets_start_on_the_clock_in_use(rpc):
+    # Built on the real clock, used on a replay clock that starts at 0.
+    governor = rpc.RequestGovernor(per_minute=60)
+    rpc.clock = rpc.ReplayClock(rpc.clock.now())
+    assert governor.acquire("teams")
+    assert governor.stats()["tokens"] == [59]
+
+
+def test_uncached_fetches_leave_the_response_cache_alone(rpc, monkeypatch):
+    client = rpc.StatsClient()
+    response = json_response(b'{"dates": []}', headers={"ETag": '"1"'})
+    monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: response)
+    assert client.get_json("/api/v1/schedule?teamId=141", "schedule", cached=False) == {"dates": []}
+    assert client.cache.dump() == []
+    assert client.get_json("/api/v1/schedule?teamId=141", "schedule") == {"dates": []}
+    assert len(client.cache.dump()) == 1
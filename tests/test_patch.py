@@ -0,0 +1,42 @@
+import pytest
+
+
+def test_add_replace_and_remove_on_objects_and_arrays(rpc):
+    doc = {"liveData": {"linescore": {"outs": 1}, "plays": [{"id": 1}, {"id": 2}]}}
+    rpc.apply_json_patch(doc, [
+        {"op": "replace", "path": "/liveData/linescore/outs", "value": 2},
+        {"op": "add", "path": "/liveData/linescore/balls", "value": 3},
+        {"op": "add", "path": "/liveData/plays/1", "value": {"id": 9}},
+        {"op": "add", "path": "/liveData/plays/-", "value": {"id": 3}},
+        {"op": "remove", "path": "/liveData/plays/0"},
+    ])
+    assert doc == {"liveData": {"linescore": {"outs": 2, "balls": 3}, "plays": [{"id": 9}, {"id": 2}, {"id": 3}]}}
+
+
+def test_move_and_copy(rpc):
+    doc = {"a": {"runner": {"id": 7}}, "b": {}, "list": [1, 2]}
+    rpc.apply_json_patch(doc, [
+        {"op": "copy", "from": "/a/runner", "path": "/b/runner"},
+        {"op": "move", "from": "/list/0", "path": "/list/-"},
+    ])
+    doc["b"]["runner"]["id"] = 8
+    assert doc["a"]["runner"] == {"id": 7}
+    assert doc["list"] == [2, 1]
+
+    rpc.apply_json_patch(doc, [{"op": "move", "from": "/a/runner", "path": "/c"}])
+    assert doc["a"] == {} and doc["c"] == {"id": 7}
+
+
+def test_escaped_pointer_tokens(rpc):
+    doc = {"a/b": {"m~n": 1}}
+    rpc.apply_json_patch(doc, [{"op": "replace", "path": "/a~1b/m~0n", "value": 2}])
+    assert doc == {"a/b": {"m~n": 2}}
+
+
+def test_failed_test_op_and_root_patches_raise(rpc):
+    doc = {"status": "Live"}
+    rpc.apply_json_patch(doc, [{"op": "test", "path": "/status", "value": "Live"}])
+    with pytest.raises(ValueError):
+        rpc.apply_json_patch(doc, [{"op": "test", "path": "/status", "value": "Final"}])
+    with pytest.raises(ValueError):
+        rpc.apply_json_patch(doc, [{"op": "replace", "path": "", "value": {}}])
@@ -0,0 +1,163 @@
+import asyncio
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+LIVE = {"details": "TOR 0 vs NYY 0", "state": "Top 1st | Bases ooo | 0 Out"}
+LATER = {"details": "TOR 1 vs NYY 0", "state": "Bottom 1st | Bases ooo | 1 Out"}
+REFUSED = {"details": "FINAL • TOR 3 vs NYY 5", "state": ""}
+
+
+def wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def test_unchanged_and_superseded_updates_are_not_sent(rpc, replay_clock):
+    presence = rpc.PresenceState(None)
+    assert presence.hold(LIVE)
+    presence.mark_sent(presence.ready())
+    assert not presence.hold(LIVE)
+    assert presence.hold(LATER) and presence.hold(LIVE)
+    assert presence.ready() is None
+    assert (presence.sent, presence.skipped, presence.coalesced) == (1, 2, 1)
+
+
+def test_rate_limit_holds_the_newest_update(rpc, replay_clock):
+    presence = rpc.PresenceState(None, limit=2, window=20)
+    for activity in (LIVE, LATER):
+        presence.hold(activity)
+        presence.mark_sent(presence.ready())
+    presence.hold(LIVE)
+    assert presence.ready() is None and presence.slot_wait() == 20
+    replay_clock.sleep(20)
+    assert presence.ready()[1] == LIVE
+
+
+def test_reset_resends_the_last_state(rpc, replay_clock):
+    presence = rpc.PresenceState(None)
+    presence.hold(LIVE)
+    presence.mark_sent(presence.ready())
+    presence.reset("new connection")
+    assert presence.ready()[1] == LIVE
+
+
+def test_rejected_update_is_not_retried(rpc, replay_clock):
+    presence = rpc.PresenceState(None)
+    presence.hold(REFUSED)
+    presence.mark_sent(presence.ready(), rejected=True)
+    assert not presence.hold(REFUSED)
+    assert presence.hold(LIVE)
+    assert (presence.sent, presence.rejected) == (0, 1)
+    assert "1 rejected" in presence.summary()
+
+
+def test_final_game_without_next_game_has_a_state(rpc):
+    record = {"wins": 33, "losses": 28}
+    game = rpc.parse_game({
+        "gamePk": 1, "gameDate": "2026-06-01T23:07:00Z",
+        "status": {"abstractGameState": "Final", "detailedState": "Final"},
+        "teams": {
+            "home": {"team": {"id": 141, "abbreviation": "TOR"}, "score": 3, "leagueRecord": record},
+            "away": {"team": {"id": 147, "abbreviation": "NYY"}, "score": 5, "leagueRecord": record},
+        },
+    })
+    window = rpc.ScheduleWindow(141)
+    window.loaded = True  # an empty schedule: no next game, no series
+
+    team_info = {"id": 141, "abbr": "TOR", "code": "tor", "name": "Toronto Blue Jays"}
+    activity = rpc.build_presence(game, team_info, rpc.timezone.utc, {"filled": "X", "empty": "o"}, {}, window)
+    assert activity["details"] == "FINAL • TOR 3 vs NYY 5"
+    assert len(activity["state"]) >= 2
+
+
+@pytest.fixture
+def fake_discord(rpc, monkeypatch, tmp_path):
+    """Run make_fake_discord_handler() on IPC pipe 0 under tmp_path, counting connections and replies."""
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("the fake Discord server needs Unix sockets")
+    pytest.importorskip("pypresence")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    base = rpc.make_fake_discord_handler()
+
+    class Handler(base):
+        def setup(self):
+            server.connections.append(self.request)
+            super().setup()
+
+        def send(self, op, payload):
+            if payload.get("evt") == "READY":
+                server.handshakes += 1
+            elif op == 1 and payload.get("cmd") == "SET_ACTIVITY":
+                server.replies.append((payload["evt"], payload["data"]))
+            super().send(op, payload)
+
+    server = socketserver.ThreadingUnixStreamServer(rpc.discord_ipc_path(0), Handler)
+    server.daemon_threads = True
+    server.connections = []
+    server.handshakes = 0
+    server.replies = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_publisher_reconnects_and_resends_after_discord_restarts(rpc, fake_discord):
+    publisher = rpc.Publisher("1", pipe=0)
+    publisher.start()
+    try:
+        publisher.submit(LIVE)
+        wait_for(lambda: publisher.presence.sent == 1)
+        for connection in fake_discord.connections:
+            if connection.fileno() != -1:
+                connection.shutdown(socket.SHUT_RDWR)
+
+        publisher.submit(LATER)
+        wait_for(lambda: publisher.presence.sent == 2)
+    finally:
+        publisher.close()
+    assert publisher.presence.reconnects == 1
+    assert fake_discord.handshakes == 2
+    assert [data["details"] for evt, data in fake_discord.replies if data] == [LIVE["details"], LATER["details"]]
+
+
+def test_publisher_drops_updates_discord_rejects(rpc, fake_discord):
+    publisher = rpc.Publisher("1", pipe=0)
+    publisher.start()
+    try:
+        publisher.submit(REFUSED)
+        wait_for(lambda: publisher.presence.rejected == 1)
+        publisher.submit(REFUSED)
+        publisher.submit(LIVE)
+        wait_for(lambda: publisher.presence.sent == 1)
+    finally:
+        publisher.close()
+    assert publisher.presence.reconnects == 0
+    assert fake_discord.handshakes == 1
+    assert [evt for evt, _ in fake_discord.replies].count("ERROR") == 1
+
+
+def test_publish_loop_survives_rejected_updates(rpc, fake_discord):
+    async def run():
+        presence = rpc.PresenceState(None)
+        queue = asyncio.Queue(maxsize=1)
+        task = asyncio.create_task(rpc.publish_loop(presence, queue, "1", 0))
+        await queue.put(REFUSED)
+        await queue.put(LIVE)
+        for _ in range(500):
+            if presence.sent or task.done():
+                break
+            await asyncio.sleep(0.02)
+        assert not task.done()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return presence
+
+    presence = asyncio.run(run())
+    assert (presence.rejected, presence.sent, presence.reconnects) == (1, 1, 0)
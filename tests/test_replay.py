@@ -0,0 +1,103 @@
+import re
+from zoneinfo import ZoneInfo
+
+from conftest import GAME_ARCHIVE
+
+
+def make_follower(rpc):
+    team_index = rpc.load_team_index()
+    profile = {"timezone": ZoneInfo("America/Toronto"), "live_only": False, "client_id": "1", "pipe": None}
+    icons = {"filled": "X", "empty": "o"}
+    return rpc.Follower(profile, rpc.fetch_team_info("TOR", team_index), icons, rpc.get_team_abbr_map(team_index))
+
+
+def record_urls(adapter):
+    """Wrap adapter.lookup so the returned list collects every URL the replay is asked for."""
+    urls = []
+    lookup = adapter.lookup
+
+    def recording_lookup(key):
+        urls.append(key)
+        return lookup(key)
+
+    adapter.lookup = recording_lookup
+    return urls
+
+
+def replay_game(rpc, team_ids=(141,), step=15):
+    """Poll the archived game every step simulated seconds.
+
+    Returns (adapter, requested URLs, the distinct activities rendered for TOR).
+    """
+    adapter, duration = rpc.start_replay(str(GAME_ARCHIVE))
+    urls = record_urls(adapter)
+    follower = make_follower(rpc)
+    source = rpc.LiveSource(list(team_ids))
+    activities = []
+    try:
+        while rpc.clock.elapsed() <= duration:
+            activity, _ = follower.render(source.fetch())
+            if not activities or activities[-1] != activity:
+                activities.append(activity)
+            rpc.clock.sleep(step)
+    finally:
+        follower.idle.close()
+    return adapter, urls, activities
+
+
+def test_replayed_game_renders_preview_live_and_final(rpc):
+    adapter, _, activities = replay_game(rpc)
+
+    assert adapter.misses == 0
+    assert activities[0]["details"].startswith("Next game: NYY vs TOR (Game 2/3)")
+    assert activities[0]["state"] == "Prev: NYY 2 - TOR 4 • TOR leads series 1-0"
+    details = [activity["details"] for activity in activities]
+    states = [activity["state"] for activity in activities]
+    assert "TOR 0 vs NYY 0" in details
+    assert "Top 1st | Bases ooo | 0 Out | Gausman pitching Judge (2-1)" in states
+    assert "Top 4th | Bases XoX | 2 Outs | Gausman pitching Judge (3-2)" in states
+    assert "Middle 1st | Bases ooo | 3 Outs | Next up: Guerrero Jr. batting Cole" in states
+    assert activities[-1]["details"] == "FINAL • TOR 3 vs NYY 5 • Series tied 1-1"
+    assert activities[-1]["state"].startswith("Next game: NYY vs TOR (Game 3/3)")
+    assert activities[-1]["large_text"] == "Toronto Blue Jays • 33-28 | Home"
+
+
+def test_live_polls_drop_the_boxscore_once_players_are_indexed(rpc):
+    # 999 has no game: it must not keep the boxscore hydrate on the shared request.
+    _, urls, activities = replay_game(rpc, team_ids=(141, 999))
+    live = [url for url in urls if url.startswith("/api/v1/schedule/games/")]
+    with_boxscore = [url for url in live if "boxscore" in url]
+
+    assert len(live) > 100
+    assert len(with_boxscore) <= 3
+    assert any("Guerrero Jr. batting Cole" in activity["state"] for activity in activities)
+
+
+def test_benchmark_replay_reports_the_game(rpc, capsys):
+    adapter, duration = rpc.start_replay(str(GAME_ARCHIVE))
+    follower = make_follower(rpc)
+    try:
+        rpc.benchmark_replay(adapter, duration, rpc.LiveSource([141]), [follower], rpc.PollScheduler({}))
+    finally:
+        follower.idle.close()
+    out = capsys.readouterr().out
+
+    assert "0 not in the archive" in out
+    assert "per live game" in out
+    assert int(re.search(r"Rendered presence updates: (\d+)", out).group(1)) >= 10
+
+
+def test_request_budget_survives_the_replay_clock(rpc, capsys):
+    # configure_client builds the token buckets before start_replay swaps the clock.
+    rpc.configure_client({"budget": {"per_minute": 60}})
+    adapter, duration = rpc.start_replay(str(GAME_ARCHIVE))
+    follower = make_follower(rpc)
+    try:
+        rpc.benchmark_replay(adapter, duration, rpc.LiveSource([141]), [follower], rpc.PollScheduler({}))
+    finally:
+        follower.idle.close()
+    out = capsys.readouterr().out
+
+    assert "budget exhausted" not in out
+    assert rpc.get_client().governor.dropped == 0
+    assert "0 not in the archive" in out
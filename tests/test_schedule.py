@@ -0,0 +1,92 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def row(pk, official_date, start, state, opponent=147):
+    game = {
+        "gamePk": pk, "gameDate": start.isoformat().replace("+00:00", "Z"),
+        "status": {"abstractGameState": state, "detailedState": "Final" if state == "Final" else "In Progress"},
+        "teams": {"home": {"team": {"id": 141}}, "away": {"team": {"id": opponent}}},
+    }
+    return (141, pk, official_date, start.timestamp(), opponent, state, json.dumps(game))
+
+
+@pytest.fixture
+def store(rpc, replay_clock, tmp_path):
+    """A ScheduleStore whose statsapi fetches are recorded and answered from store.rows."""
+    store = rpc.ScheduleStore(str(tmp_path / "schedule.sqlite3"), refresh_interval=600)
+    store.rows = []
+    store.fetches = []
+
+    def fetch(team_id, start_date, end_date):
+        store.fetches.append((start_date, end_date))
+        return [r for r in store.rows if start_date <= r[2] <= end_date]
+
+    store._fetch = fetch
+    yield store
+    store.close()
+
+
+def test_season_loads_once_then_refreshes_on_interval(rpc, replay_clock, store):
+    store.refresh(141)
+    assert store.fetches == [("2026-01-01", "2026-12-31")]
+
+    store.refresh(141)
+    assert len(store.fetches) == 1
+
+    replay_clock.sleep(600)
+    store.refresh(141)
+    assert store.fetches[-1] == ("2026-05-31", "2026-06-03")
+
+
+def test_game_in_progress_is_left_to_the_live_poll(rpc, replay_clock, store):
+    now = replay_clock.now()
+    store.rows = [row(1, "2026-06-01", now - timedelta(hours=1), "Live")]
+    store.refresh(141)
+    for _ in range(5):
+        replay_clock.sleep(15)
+        store.refresh(141)
+    assert len(store.fetches) == 1
+
+
+def test_overdue_game_is_refetched_from_its_official_date(rpc, replay_clock, store):
+    # A West-coast night game: official date May 30, first pitch after midnight UTC.
+    start = datetime(2026, 5, 31, 2, 10, tzinfo=timezone.utc)
+    store.rows = [row(1, "2026-05-30", start, "Live")]
+    store.refresh(141)
+    replay_clock.sleep(15)
+    store.refresh(141)
+    assert store.fetches[-1] == ("2026-05-30", "2026-06-03")
+
+
+def test_final_in_live_data_refreshes_at_once(rpc, replay_clock, store):
+    now = replay_clock.now()
+    store.rows = [row(1, "2026-06-01", now - timedelta(hours=2), "Live")]
+    store.refresh(141)
+    store.rows = [row(1, "2026-06-01", now - timedelta(hours=2), "Final")]
+    live_game = rpc.parse_game(json.loads(store.rows[0][6]))
+
+    rpc._schedule_store = store
+    window = rpc.open_schedule(141, live_game)
+    window.previous_game()
+    assert len(store.fetches) == 2
+    assert window.previous_game()[0].abstract_state == "Final"
+
+    rpc.open_schedule(141, live_game).ensure()
+    assert len(store.fetches) == 2
+
+
+def test_queries_answer_from_stored_rows(rpc, replay_clock, store):
+    now = replay_clock.now()
+    store.rows = [
+        row(1, "2026-05-31", now - timedelta(days=1), "Final"),
+        row(2, "2026-06-02", now + timedelta(days=1), "Preview"),
+        row(3, "2026-06-05", now + timedelta(days=4), "Preview", opponent=111),
+    ]
+    rpc._schedule_store = store
+    window = rpc.open_schedule(141)
+    assert window.previous_game()[0].game_pk == 1
+    assert window.next_game()[0].game_pk == 2
+    assert [g.game_pk for g in window.series_games(window.next_game()[0], 147)] == [2]